@@ -0,0 +1,34 @@
+from pathlib import Path
+import sys
+
+#!/usr/bin/env python3
+"""
+Monthly Analysis
+
+Comprehensive monthly performance analysis.
+"""
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from telemetry.analyzer import TelemetryAnalyzer
+from datetime import datetime
+
+def monthly_analysis():
+    print(f"\n📊 Monthly Analysis: {datetime.now().strftime('%B %Y')}")
+    print("="*70)
+
+    analyzer = TelemetryAnalyzer()
+    stats = analyzer.generate_statistics()
+
+    # TODO: Comprehensive analysis
+    # - Month-over-month trends
+    # - Agent improvement tracking
+    # - ROI calculations
+    # - Recommendations for next month
+
+    print("\n✓ Monthly analysis complete")
+    print("  See: reports/monthly/")
+
+if __name__ == "__main__":
+    monthly_analysis()
@@ -0,0 +1,59 @@
+from pathlib import Path
+import sys
+
+#!/usr/bin/env python3
+"""
+Weekly Review
+
+Automated weekly performance review.
+"""
+
+import sys
+from datetime import datetime, timedelta
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from telemetry.analyzer import TelemetryAnalyzer
+
+def weekly_review():
+    print(f"\n📊 Weekly Review: {datetime.now().strftime('%Y-%m-%d')}")
+    print("="*70)
+
+    analyzer = TelemetryAnalyzer()
+    stats = analyzer.generate_statistics()
+
+    print(f"\nTotal Invocations: {stats['total_invocations']}")
+    print(f"Active Agents: {len(stats['agents'])}")
+
+    # Calculate overall success rate
+    total_success = sum(a["success_rate"] * a["invocation_count"]
+                       for a in stats["agents"].values())
+    total_count = sum(a["invocation_count"] for a in stats["agents"].values())
+    overall_success = total_success / total_count if total_count > 0 else 0
+
+    print(f"Overall Success Rate: {overall_success*100:.1f}%")
+
+    # Top performers
+    top = sorted(stats["agents"].items(),
+                key=lambda x: x[1]["success_rate"],
+                reverse=True)[:3]
+
+    print("\nTop Performers:")
+    for name, agent_stats in top:
+        print(f"  ✓ {name}: {agent_stats['success_rate']*100:.0f}% success")
+
+    # Needs attention
+    needs_attention = [(name, a) for name, a in stats["agents"].items()
+                       if a["success_rate"] < 0.75 and a["invocation_count"] >= 5]
+
+    if needs_attention:
+        print("\nNeeds Attention:")
+        for name, agent_stats in needs_attention:
+            print(f"  ⚠️  {name}: {agent_stats['success_rate']*100:.0f}% success")
+
+    # Generate HTML report
+    # TODO: Create detailed HTML report
+
+    print("\n✓ Weekly review complete")
+
+if __name__ == "__main__":
+    weekly_review()
@@ -197,8 +197,10 @@ def monthly_analysis():
         improving_agents = []
         declining_agents = []
 
+        trends = analyzer.get_agent_performance_trends_bulk(active_agents, days=30)
+
         for agent_name in sorted(active_agents):
-            trend_data = analyzer.get_agent_performance_trends(agent_name, days=30)
+            trend_data = trends[agent_name]
 
             if trend_data['trend'] == 'improving' and trend_data['success_rate_change'] > 0.05:
                 improving_agents.append((agent_name, trend_data))
@@ -16,7 +16,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from telemetry.logger import TelemetryLogger
 from telemetry.analyzer import TelemetryAnalyzer
-from scripts.query_best_agent import query_best_agent
+from scripts.query_best_agent import query_best_agent, prepare_invocations
 
 
 def create_sample_telemetry_data(logger: TelemetryLogger):
@@ -225,7 +225,7 @@ def demo_agent_selection(logger: TelemetryLogger):
 
     # Create analyzer for this telemetry directory
     analyzer = TelemetryAnalyzer(telemetry_dir=logger.telemetry_dir)
-    invocations = analyzer.load_invocations()
+    invocations = prepare_invocations(analyzer.load_invocations())
 
     if not invocations:
         print("\nNo telemetry data available for queries")
@@ -243,16 +243,19 @@ def demo_agent_selection(logger: TelemetryLogger):
 
         # Use the query function but with explicit telemetry directory
         # We'll inline the logic here for demo purposes
-        from scripts.query_best_agent import extract_keywords, calculate_relevance_score, AgentRecommendation
+        from scripts.query_best_agent import extract_keywords, calculate_relevance_score, build_recommendation
         from collections import defaultdict
+        from operator import attrgetter
 
         task_keywords = extract_keywords(task)
+        domain_lower = domain.lower() if domain else None
 
         agent_scores = defaultdict(lambda: {
             "relevance_sum": 0.0,
             "invocations": [],
             "successes": 0,
-            "durations": []
+            "duration_sum": 0.0,
+            "duration_count": 0
         })
 
         for inv in invocations:
@@ -260,7 +263,7 @@ def demo_agent_selection(logger: TelemetryLogger):
             if not agent_name:
                 continue
 
-            relevance = calculate_relevance_score(task_keywords, inv, domain)
+            relevance = calculate_relevance_score(task_keywords, inv, domain_lower)
 
             if relevance > 0:
                 agent_scores[agent_name]["relevance_sum"] += relevance
@@ -271,44 +274,21 @@ def demo_agent_selection(logger: TelemetryLogger):
 
                 duration = inv.get("duration_seconds")
                 if duration:
-                    agent_scores[agent_name]["durations"].append(duration)
+                    agent_scores[agent_name]["duration_sum"] += duration
+                    agent_scores[agent_name]["duration_count"] += 1
 
         if not agent_scores:
             print("  No suitable agent found")
             continue
 
-        recommendations = []
-        for agent_name, data in agent_scores.items():
-            total_tasks = len(data["invocations"])
-            if total_tasks == 0:
-                continue
-
-            success_rate = data["successes"] / total_tasks
-            avg_duration = (
-                sum(data["durations"]) / len(data["durations"])
-                if data["durations"] else 0.0
-            )
-            avg_duration_minutes = avg_duration / 60
-
-            avg_relevance = data["relevance_sum"] / total_tasks
-            task_count_factor = min(total_tasks / 10.0, 1.0)
-            confidence = (avg_relevance * 0.6 + task_count_factor * 0.4) * success_rate
-            confidence = min(confidence / 3.0, 1.0)
-
-            trend_data = analyzer.get_agent_performance_trends(agent_name)
-            recent_performance = trend_data.get("trend", "stable")
-
-            recommendations.append(AgentRecommendation(
-                agent_name=agent_name,
-                confidence=confidence,
-                success_rate=success_rate,
-                avg_duration_minutes=avg_duration_minutes,
-                total_tasks=total_tasks,
-                recent_performance=recent_performance
-            ))
-
-        recommendations = [r for r in recommendations if r.confidence >= 0.3]
-        recommendations.sort(key=lambda r: r.confidence, reverse=True)
+        trends = analyzer.get_agent_performance_trends_bulk(agent_scores)
+        candidates = (
+            build_recommendation(agent_name, data, trends[agent_name])
+            for agent_name, data in agent_scores.items()
+            if data["invocations"]
+        )
+        recommendations = [r for r in candidates if r.confidence >= 0.3]
+        recommendations.sort(key=attrgetter("confidence"), reverse=True)
 
         if recommendations:
             rec = recommendations[0]
@@ -16,6 +16,7 @@ import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -26,7 +27,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from telemetry.analyzer import TelemetryAnalyzer
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentRecommendation:
     """Agent recommendation with performance metrics."""
     agent_name: str
@@ -57,18 +58,40 @@ def extract_keywords(text: str) -> List[str]:
     return keywords
 
 
+def _task_type_lower(invocation: Dict) -> str:
+    """Return the invocation's lowercase task type from its state features."""
+    return invocation.get("state_features", {}).get("task", {}).get("type", "").lower()
+
+
+def prepare_invocations(invocations: List[Dict]) -> List[Dict]:
+    """
+    Cache derived scoring features on each invocation.
+    
+    Adds a flat "_task_type_lower" key so repeated relevance scoring over
+    the same invocations skips the nested state_features lookups.
+    """
+    for inv in invocations:
+        inv["_task_type_lower"] = _task_type_lower(inv)
+    return invocations
+
+
 def calculate_relevance_score(
     task_keywords: List[str],
     invocation: Dict,
-    domain: Optional[str] = None
+    domain_lower: Optional[str] = None
 ) -> float:
-    """Calculate how relevant an invocation is to the task."""
+    """
+    Calculate how relevant an invocation is to the task.
+    
+    Args:
+        task_keywords: Lowercase keywords from extract_keywords()
+        invocation: Invocation record from telemetry
+        domain_lower: Optional domain filter, already lowercased by the caller
+    """
     score = 0.0
     
     # Extract text from invocation
     task_desc = invocation.get("task_description", "").lower()
-    agent_type = invocation.get("agent_type", "").lower()
-    state_features = invocation.get("state_features", {})
     
     # Check task description keyword matches
     for keyword in task_keywords:
@@ -76,21 +99,61 @@ def calculate_relevance_score(
             score += 1.0
     
     # Check domain match if specified
-    if domain:
-        domain_lower = domain.lower()
-        
+    if domain_lower:
         # Check agent type
+        agent_type = invocation.get("agent_type", "").lower()
         if domain_lower in agent_type:
             score += 2.0
         
         # Check state features
-        task_type = state_features.get("task", {}).get("type", "").lower()
+        task_type = invocation.get("_task_type_lower")
+        if task_type is None:
+            task_type = _task_type_lower(invocation)
         if domain_lower in task_type:
             score += 1.5
     
     return score
 
 
+def build_recommendation(
+    agent_name: str,
+    data: Dict,
+    trend_data: Dict
+) -> AgentRecommendation:
+    """Build a recommendation from an agent's accumulated relevance scores."""
+    total_tasks = len(data["invocations"])
+    
+    # Calculate success rate
+    success_rate = data["successes"] / total_tasks
+    
+    # Calculate average duration
+    avg_duration = (
+        data["duration_sum"] / data["duration_count"]
+        if data["duration_count"] else 0.0
+    )
+    avg_duration_minutes = avg_duration / 60
+    
+    # Calculate confidence based on relevance and task count
+    avg_relevance = data["relevance_sum"] / total_tasks
+    task_count_factor = min(total_tasks / 10.0, 1.0)  # Max out at 10 tasks
+    confidence = (avg_relevance * 0.6 + task_count_factor * 0.4) * success_rate
+    
+    # Normalize confidence to 0-1 range
+    confidence = min(confidence / 3.0, 1.0)  # Assuming max relevance of ~3
+    
+    # Get performance trend
+    recent_performance = trend_data.get("trend", "stable")
+    
+    return AgentRecommendation(
+        agent_name=agent_name,
+        confidence=confidence,
+        success_rate=success_rate,
+        avg_duration_minutes=avg_duration_minutes,
+        total_tasks=total_tasks,
+        recent_performance=recent_performance
+    )
+
+
 def query_best_agent(
     task_description: str,
     domain: Optional[str] = None,
@@ -109,20 +172,22 @@ def query_best_agent(
     """
     # Load telemetry data
     analyzer = TelemetryAnalyzer()
-    invocations = analyzer.load_invocations()
+    invocations = prepare_invocations(analyzer.load_invocations())
     
     if not invocations:
         return None
     
     # Extract keywords from task description
     task_keywords = extract_keywords(task_description)
+    domain_lower = domain.lower() if domain else None
     
     # Score each invocation for relevance
     agent_scores = defaultdict(lambda: {
         "relevance_sum": 0.0,
         "invocations": [],
         "successes": 0,
-        "durations": []
+        "duration_sum": 0.0,
+        "duration_count": 0
     })
     
     for inv in invocations:
@@ -131,7 +196,7 @@ def query_best_agent(
             continue
         
         # Calculate relevance
-        relevance = calculate_relevance_score(task_keywords, inv, domain)
+        relevance = calculate_relevance_score(task_keywords, inv, domain_lower)
         
         if relevance > 0:
             agent_scores[agent_name]["relevance_sum"] += relevance
@@ -144,58 +209,26 @@ def query_best_agent(
             # Track duration
             duration = inv.get("duration_seconds")
             if duration:
-                agent_scores[agent_name]["durations"].append(duration)
+                agent_scores[agent_name]["duration_sum"] += duration
+                agent_scores[agent_name]["duration_count"] += 1
     
     if not agent_scores:
         return None
     
-    # Calculate final scores for each agent
-    recommendations = []
-    
-    for agent_name, data in agent_scores.items():
-        total_tasks = len(data["invocations"])
-        if total_tasks == 0:
-            continue
-        
-        # Calculate success rate
-        success_rate = data["successes"] / total_tasks
-        
-        # Calculate average duration
-        avg_duration = (
-            sum(data["durations"]) / len(data["durations"])
-            if data["durations"] else 0.0
-        )
-        avg_duration_minutes = avg_duration / 60
-        
-        # Calculate confidence based on relevance and task count
-        avg_relevance = data["relevance_sum"] / total_tasks
-        task_count_factor = min(total_tasks / 10.0, 1.0)  # Max out at 10 tasks
-        confidence = (avg_relevance * 0.6 + task_count_factor * 0.4) * success_rate
-        
-        # Normalize confidence to 0-1 range
-        confidence = min(confidence / 3.0, 1.0)  # Assuming max relevance of ~3
-        
-        # Get performance trend
-        trend_data = analyzer.get_agent_performance_trends(agent_name)
-        recent_performance = trend_data.get("trend", "stable")
-        
-        recommendations.append(AgentRecommendation(
-            agent_name=agent_name,
-            confidence=confidence,
-            success_rate=success_rate,
-            avg_duration_minutes=avg_duration_minutes,
-            total_tasks=total_tasks,
-            recent_performance=recent_performance
-        ))
-    
-    # Filter by minimum confidence
-    recommendations = [r for r in recommendations if r.confidence >= min_confidence]
+    # Score each agent and keep those above the confidence threshold
+    trends = analyzer.get_agent_performance_trends_bulk(agent_scores)
+    candidates = (
+        build_recommendation(agent_name, data, trends[agent_name])
+        for agent_name, data in agent_scores.items()
+        if data["invocations"]
+    )
+    recommendations = [r for r in candidates if r.confidence >= min_confidence]
     
     if not recommendations:
         return None
     
     # Sort by confidence (descending)
-    recommendations.sort(key=lambda r: r.confidence, reverse=True)
+    recommendations.sort(key=attrgetter("confidence"), reverse=True)
     
     return recommendations[0]
 
@@ -234,14 +267,16 @@ def main():
     # If --all flag, show all recommendations
     if args.all:
         analyzer = TelemetryAnalyzer()
-        invocations = analyzer.load_invocations()
+        invocations = prepare_invocations(analyzer.load_invocations())
         task_keywords = extract_keywords(args.task)
+        domain_lower = args.domain.lower() if args.domain else None
         
         agent_scores = defaultdict(lambda: {
             "relevance_sum": 0.0,
             "invocations": [],
             "successes": 0,
-            "durations": []
+            "duration_sum": 0.0,
+            "duration_count": 0
         })
         
         for inv in invocations:
@@ -249,7 +284,7 @@ def main():
             if not agent_name:
                 continue
             
-            relevance = calculate_relevance_score(task_keywords, inv, args.domain)
+            relevance = calculate_relevance_score(task_keywords, inv, domain_lower)
             
             if relevance > 0:
                 agent_scores[agent_name]["relevance_sum"] += relevance
@@ -260,40 +295,17 @@ def main():
                 
                 duration = inv.get("duration_seconds")
                 if duration:
-                    agent_scores[agent_name]["durations"].append(duration)
+                    agent_scores[agent_name]["duration_sum"] += duration
+                    agent_scores[agent_name]["duration_count"] += 1
         
-        all_recs = []
-        for agent_name, data in agent_scores.items():
-            total_tasks = len(data["invocations"])
-            if total_tasks == 0:
-                continue
-            
-            success_rate = data["successes"] / total_tasks
-            avg_duration = (
-                sum(data["durations"]) / len(data["durations"])
-                if data["durations"] else 0.0
-            )
-            avg_duration_minutes = avg_duration / 60
-            
-            avg_relevance = data["relevance_sum"] / total_tasks
-            task_count_factor = min(total_tasks / 10.0, 1.0)
-            confidence = (avg_relevance * 0.6 + task_count_factor * 0.4) * success_rate
-            confidence = min(confidence / 3.0, 1.0)
-            
-            trend_data = analyzer.get_agent_performance_trends(agent_name)
-            recent_performance = trend_data.get("trend", "stable")
-            
-            all_recs.append(AgentRecommendation(
-                agent_name=agent_name,
-                confidence=confidence,
-                success_rate=success_rate,
-                avg_duration_minutes=avg_duration_minutes,
-                total_tasks=total_tasks,
-                recent_performance=recent_performance
-            ))
-        
-        all_recs = [r for r in all_recs if r.confidence >= args.min_confidence]
-        all_recs.sort(key=lambda r: r.confidence, reverse=True)
+        trends = analyzer.get_agent_performance_trends_bulk(agent_scores)
+        candidates = (
+            build_recommendation(agent_name, data, trends[agent_name])
+            for agent_name, data in agent_scores.items()
+            if data["invocations"]
+        )
+        all_recs = [r for r in candidates if r.confidence >= args.min_confidence]
+        all_recs.sort(key=attrgetter("confidence"), reverse=True)
         
         if len(all_recs) > 1:
             print(f"\nAll Matching Agents ({len(all_recs)}):")
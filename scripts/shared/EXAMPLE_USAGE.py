@@ -5,7 +5,10 @@ Example script demonstrating shared utilities usage.
 This shows how to use all shared utilities in a real oak-* script.
 """
 
+import os
 import sys
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 
 # Import all shared utilities
@@ -14,13 +17,17 @@ from scripts.shared import (
     create_base_parser,
     get_project_root,
     load_invocations,
-    get_recent_invocations,
+    iter_recent_invocations,
     parse_frontmatter,
-    get_agent_category,
-    get_category_color
+    categorize,
+    get_category_ansi
 )
 
 
+# One row of the recent-activity table
+_ROW_FMT = "{c}{a:25}{r} {sc}{s:10}{r} {d:>6.1f}s"
+
+
 def main():
     # 1. CREATE CLI PARSER with common args
     parser = create_base_parser(
@@ -48,13 +55,16 @@ def main():
     
     telemetry_file = project_root / 'telemetry' / 'agent_invocations.jsonl'
     
-    # Load recent invocations (last N days)
-    recent_invocations = get_recent_invocations(
+    # Stream recent invocations (last N days): keep only the first
+    # --limit records for display and count the rest
+    recent_iter = iter_recent_invocations(
         project_root / 'telemetry',
         days=args.days
     )
+    recent_invocations = list(islice(recent_iter, args.limit))
+    recent_count = len(recent_invocations) + sum(1 for _ in recent_iter)
     
-    print(f"Loaded {Colors.GREEN}{len(recent_invocations)}{Colors.RESET} "
+    print(f"Loaded {Colors.GREEN}{recent_count}{Colors.RESET} "
           f"invocations from last {args.days} days")
     
     # 5. PARSE AGENT METADATA
@@ -64,18 +74,22 @@ def main():
     agents_dir = project_root / 'agents'
     agent_categories = {}
     
-    for agent_file in sorted(agents_dir.glob('*.md')):
-        if agent_file.name == 'README.md':
-            continue
-        
+    with os.scandir(agents_dir) as entries:
+        agent_entries = sorted(
+            (entry for entry in entries
+             if entry.name.endswith('.md') and entry.name != 'README.md'
+             and not entry.name.startswith('.') and entry.is_file()),
+            key=attrgetter('name')
+        )
+    
+    for entry in agent_entries:
         # Parse frontmatter
-        metadata, content = parse_frontmatter(agent_file)
-        agent_name = metadata.get('agent_name', agent_file.stem)
+        metadata, content = parse_frontmatter(Path(entry.path))
+        agent_name = metadata.get('agent_name', entry.name[:-3])
         
         # Get category and color
-        category = get_agent_category(agent_name)
-        color_name = get_category_color(category)
-        color = getattr(Colors, color_name, Colors.WHITE)
+        category = categorize(agent_name)
+        color = get_category_ansi(category)
         
         # Group by category
         if category not in agent_categories:
@@ -83,28 +97,33 @@ def main():
         agent_categories[category].append((agent_name, color))
     
     # 6. DISPLAY RESULTS with colors
+    bold, reset = Colors.BOLD, Colors.RESET
     for category in sorted(agent_categories.keys()):
-        category_color = getattr(Colors, get_category_color(category), Colors.WHITE)
-        print(f"\n{Colors.BOLD}{category_color}{category.upper()}{Colors.RESET}")
+        category_color = get_category_ansi(category)
+        print(f"\n{bold}{category_color}{category.upper()}{reset}")
         
         for agent_name, color in sorted(agent_categories[category])[:args.limit]:
-            print(f"  {color}• {agent_name}{Colors.RESET}")
+            print(f"  {color}• {agent_name}{reset}")
     
     # 7. SHOW RECENT ACTIVITY
     print(f"\n{Colors.BOLD}{Colors.BLUE}Recent Activity{Colors.RESET}")
     print("=" * 60)
     
-    for inv in recent_invocations[:args.limit]:
+    # Buffer rows and write them in one call
+    cyan, green, red = Colors.CYAN, Colors.GREEN, Colors.RED
+    lines = []
+    for inv in recent_invocations:
         agent = inv.get('agent_name', 'unknown')
         status = inv.get('outcome', {}).get('status', 'unknown')
         duration = inv.get('duration_seconds', 0)
         
         # Color code status
-        status_color = Colors.GREEN if status == 'success' else Colors.RED
+        status_color = green if status == 'success' else red
         
-        print(f"{Colors.CYAN}{agent:25}{Colors.RESET} "
-              f"{status_color}{status:10}{Colors.RESET} "
-              f"{duration:>6.1f}s")
+        lines.append(_ROW_FMT.format(c=cyan, a=agent, r=reset, sc=status_color,
+                                     s=status, d=duration))
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     
     print(f"\n{Colors.GREEN}✓ Example completed successfully{Colors.RESET}\n")
     return 0
@@ -7,18 +7,39 @@ Only add utilities here when they're genuinely shared across 2+ agents.
 Philosophy: KISS - Don't create abstractions until duplication proves they're needed.
 """
 
-from .colors import Colors
-from .telemetry_loader import load_invocations, get_recent_invocations, get_workflow_invocations
-from .markdown_utils import parse_frontmatter, parse_frontmatter_string, get_metadata
-from .cli_utils import create_base_parser, get_project_root
-from .agent_utils import get_agent_category, get_category_color, get_agent_type_category
+import importlib
+
+# Public name -> submodule. Submodules are imported on first attribute
+# access (PEP 562) so a script that only needs Colors doesn't pay for
+# argparse, json, re, etc.
+_LAZY = {
+    'Colors': 'colors',
+    'load_invocations': 'telemetry_loader',
+    'load_invocations_multi': 'telemetry_loader',
+    'get_recent_invocations': 'telemetry_loader',
+    'iter_recent_invocations': 'telemetry_loader',
+    'get_workflow_invocations': 'telemetry_loader',
+    'parse_frontmatter': 'markdown_utils',
+    'parse_frontmatter_string': 'markdown_utils',
+    'get_metadata': 'markdown_utils',
+    'create_base_parser': 'cli_utils',
+    'get_project_root': 'cli_utils',
+    'get_agent_category': 'agent_utils',
+    'categorize': 'agent_utils',
+    'in_category': 'agent_utils',
+    'get_category_color': 'agent_utils',
+    'get_category_ansi': 'agent_utils',
+    'get_agent_type_category': 'agent_utils',
+}
 
 __version__ = "1.0.0"
 
 __all__ = [
     'Colors',
     'load_invocations',
+    'load_invocations_multi',
     'get_recent_invocations',
+    'iter_recent_invocations',
     'get_workflow_invocations',
     'parse_frontmatter',
     'parse_frontmatter_string',
@@ -26,6 +47,22 @@ __all__ = [
     'create_base_parser',
     'get_project_root',
     'get_agent_category',
+    'categorize',
+    'in_category',
     'get_category_color',
+    'get_category_ansi',
     'get_agent_type_category',
 ]
+
+
+def __getattr__(name):
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{submodule}', __name__), name)
+    globals()[name] = value  # Cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
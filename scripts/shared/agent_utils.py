@@ -1,6 +1,82 @@
 """Agent metadata and categorization utilities."""
 
-from typing import Dict
+import re
+from typing import Dict, FrozenSet, List
+
+from .colors import Colors
+
+
+# Display categories and the agents that belong to them
+_CATEGORIES: Dict[str, List[str]] = {
+    'product': ['product-strategist', 'business-analyst', 'spec-manager'],
+    'development': ['frontend-developer', 'backend-architect', 'mobile-developer', 
+                   'blockchain-developer', 'ml-engineer'],
+    'quality': ['code-reviewer', 'quality-gate', 'unit-test-expert', 'qa-specialist'],
+    'security': ['security-auditor', 'dependency-scanner'],
+    'infrastructure': ['infrastructure-specialist', 'systems-architect'],
+    'workflow': ['git-workflow-manager', 'project-manager', 'changelog-recorder'],
+    'analysis': ['data-scientist', 'state-analyzer', 'agent-auditor', 
+                'performance-optimizer', 'debug-specialist'],
+    'documentation': ['technical-writer', 'content-writer'],
+    'special': ['design-simplicity-advisor', 'agent-creator', 'general-purpose']
+}
+
+# Reverse map: agent name -> category (each agent is listed in one category)
+_AGENT_TO_CATEGORY: Dict[str, str] = {
+    agent: category
+    for category, agents in _CATEGORIES.items()
+    for agent in agents
+}
+
+# Single alternation with one named group per category, for bulk scans
+_CATEGORY_RE = re.compile('|'.join(
+    f"(?P<{category}>{'|'.join(map(re.escape, agents))})"
+    for category, agents in _CATEGORIES.items()
+))
+
+# Category -> frozenset of agents, for O(1) membership checks
+_CATEGORY_SETS: Dict[str, FrozenSet[str]] = {
+    category: frozenset(agents)
+    for category, agents in _CATEGORIES.items()
+}
+
+_CATEGORY_COLORS: Dict[str, str] = {
+    'product': 'BLUE',
+    'development': 'GREEN',
+    'quality': 'CYAN',
+    'security': 'RED',
+    'infrastructure': 'MAGENTA',
+    'workflow': 'YELLOW',
+    'analysis': 'CYAN',
+    'documentation': 'BLUE',
+    'special': 'MAGENTA'
+}
+
+# Category -> ANSI code, rebuilt by Colors.refresh_maps() (e.g. after disable())
+_CATEGORY_ANSI: Dict[str, str] = {}
+
+
+def _build_category_ansi() -> None:
+    global _CATEGORY_ANSI
+    _CATEGORY_ANSI = {
+        category: getattr(Colors, color_name)
+        for category, color_name in _CATEGORY_COLORS.items()
+    }
+
+
+_build_category_ansi()
+Colors._refresh_hooks.append(_build_category_ansi)
+
+_AGENT_TYPE_CATEGORIES: Dict[str, str] = {
+    'development': 'Development',
+    'quality': 'Quality & Testing',
+    'security': 'Security',
+    'infrastructure': 'Infrastructure',
+    'documentation': 'Documentation',
+    'meta': 'Meta & Planning',
+    'analysis': 'Analysis',
+    'utility': 'Utility'
+}
 
 
 def get_agent_category(agent_name: str) -> str:
@@ -10,41 +86,33 @@ def get_agent_category(agent_name: str) -> str:
     Returns:
         Category name for display grouping
     """
-    categories = {
-        'product': ['product-strategist', 'business-analyst', 'spec-manager'],
-        'development': ['frontend-developer', 'backend-architect', 'mobile-developer', 
-                       'blockchain-developer', 'ml-engineer'],
-        'quality': ['code-reviewer', 'quality-gate', 'unit-test-expert', 'qa-specialist'],
-        'security': ['security-auditor', 'dependency-scanner'],
-        'infrastructure': ['infrastructure-specialist', 'systems-architect'],
-        'workflow': ['git-workflow-manager', 'project-manager', 'changelog-recorder'],
-        'analysis': ['data-scientist', 'state-analyzer', 'agent-auditor', 
-                    'performance-optimizer', 'debug-specialist'],
-        'documentation': ['technical-writer', 'content-writer'],
-        'special': ['design-simplicity-advisor', 'agent-creator', 'general-purpose']
-    }
-    
-    for category, agents in categories.items():
-        if agent_name in agents:
-            return category
+    return _AGENT_TO_CATEGORY.get(agent_name, 'other')
+
+
+def categorize(agent_name: str) -> str:
+    """
+    Map agent name to display category using the precompiled alternation.
     
-    return 'other'
+    Same result as get_agent_category(); intended for batch scans over
+    every agent file.
+    """
+    match = _CATEGORY_RE.fullmatch(agent_name)
+    return match.lastgroup if match else 'other'
+
+
+def in_category(agent_name: str, category: str) -> bool:
+    """Check whether an agent belongs to a display category."""
+    return agent_name in _CATEGORY_SETS.get(category, ())
 
 
 def get_category_color(category: str) -> str:
     """Get display color for agent category."""
-    colors = {
-        'product': 'BLUE',
-        'development': 'GREEN',
-        'quality': 'CYAN',
-        'security': 'RED',
-        'infrastructure': 'MAGENTA',
-        'workflow': 'YELLOW',
-        'analysis': 'CYAN',
-        'documentation': 'BLUE',
-        'special': 'MAGENTA'
-    }
-    return colors.get(category, 'WHITE')
+    return _CATEGORY_COLORS.get(category, 'WHITE')
+
+
+def get_category_ansi(category: str) -> str:
+    """Get the ANSI code for an agent category's display color."""
+    return _CATEGORY_ANSI.get(category, Colors.WHITE)
 
 
 def get_agent_type_category(agent_type: str) -> str:
@@ -53,14 +121,4 @@ def get_agent_type_category(agent_type: str) -> str:
     
     This is used when reading from frontmatter metadata.
     """
-    category_map = {
-        'development': 'Development',
-        'quality': 'Quality & Testing',
-        'security': 'Security',
-        'infrastructure': 'Infrastructure',
-        'documentation': 'Documentation',
-        'meta': 'Meta & Planning',
-        'analysis': 'Analysis',
-        'utility': 'Utility'
-    }
-    return category_map.get(agent_type, 'Other')
+    return _AGENT_TYPE_CATEGORIES.get(agent_type, 'Other')
@@ -25,9 +25,28 @@ class Colors:
     RESET = '\033[0m'
     END = '\033[0m'  # Alias for RESET (compatibility)
     
+    # Every code attribute above, cleared by disable()
+    _COLOR_ATTRS = (
+        'RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN', 'WHITE',
+        'HEADER', 'BOLD', 'DIM', 'UNDERLINE', 'RESET', 'END',
+    )
+    _disabled = False
+    
+    # Callbacks that rebuild lookup tables derived from the codes above
+    _refresh_hooks = []
+    
     @classmethod
     def disable(cls):
         """Disable all colors (for --no-color flag)."""
-        for attr in dir(cls):
-            if not attr.startswith('_') and attr.isupper():
-                setattr(cls, attr, '')
+        if cls._disabled:
+            return
+        for attr in cls._COLOR_ATTRS:
+            setattr(cls, attr, '')
+        cls._disabled = True
+        cls.refresh_maps()
+    
+    @classmethod
+    def refresh_maps(cls):
+        """Rebuild derived color maps after the codes change."""
+        for hook in cls._refresh_hooks:
+            hook()
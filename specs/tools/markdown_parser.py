@@ -9,12 +9,99 @@ Author: backend-architect
 Task: task-1 (spec-20251023-spec-to-yaml-translator)
 """
 
+import mmap
 import re
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Pattern, Tuple
 from pathlib import Path
 from datetime import datetime
 
 
+# Precompiled patterns: '_SECTION' patterns capture a numbered subsection of
+# the spec, item patterns are then applied to the captured text. Lazy groups
+# inside an item are kept from running into the next item ((?!\n-). or
+# [^\n]); otherwise an item missing its delimiter makes every later item
+# rescan the rest of the section and parsing goes quadratic or worse.
+
+# Spec files above this size are decoded straight from an mmap of the file
+_MMAP_THRESHOLD = 1 << 20
+
+# Numbered subsection headings ("### 1.1 Primary Goal")
+_RE_SUBSECTION_HEADING = re.compile(r'^### (\S+)', re.MULTILINE)
+
+# Metadata
+_RE_SPEC_ID = re.compile(r'\*\*Spec ID\*\*:\s*(.+)')
+_RE_CREATED = re.compile(r'\*\*Created\*\*:\s*(.+)')
+_RE_UPDATED = re.compile(r'\*\*Updated\*\*:\s*(.+)')
+_RE_STATUS = re.compile(r'\*\*Status\*\*:\s*(.+)')
+
+# 1.x Goals & Requirements
+_RE_PRIMARY_GOAL_SECTION = re.compile(r'### 1\.1 Primary Goal(.+?)(?=\n### |\n## |$)', re.DOTALL)
+_RE_USER_STORIES_SECTION = re.compile(r'### 1\.2 User Stories(.+?)(?=\n### |\n## |$)', re.DOTALL)
+_RE_USER_STORY = re.compile(r'-\s+\*\*As an? ((?:(?!\n-).)+?)\*\*,\s+\*\*I want\*\*\s+((?:(?!\n-).)+?),\s+\*\*so that\*\*\s+(.+?)(?=\n-|\n###|\n##|$)', re.DOTALL)
+_RE_ACCEPTANCE_SECTION = re.compile(r'### 1\.3 Acceptance Criteria\n.+?\n\n(.+?)(?=###|\n##|$)', re.DOTALL)
+_RE_ACCEPTANCE_ITEM = re.compile(r'-\s+\[([x ])\]\s+\*\*([A-Z]+-\d+)\*\*:\s+(.+?)(?=\n-|\n###|\n##|$)', re.DOTALL)
+_RE_METRICS_SECTION = re.compile(r'### 1\.4 Success Metrics\n.+?\n\n(.+?)(?=\n### |\n## |$)', re.DOTALL)
+_RE_METRIC_ITEM = re.compile(r'-\s+(.+?)(?:\n(?=-)|$)')
+_RE_OUT_OF_SCOPE_SECTION = re.compile(r'### 1\.5 Out of Scope\n.+?\n\n(.+?)(?=\n### |\n## |\n---|$)', re.DOTALL)
+_RE_OUT_OF_SCOPE_ITEM = re.compile(r'-\s+(.+?)(?:\n(?=-)|$)')
+
+# 2.x Technical Design
+_RE_ARCHITECTURE_SECTION = re.compile(r'### 2\.1 Architecture Overview\n(.+?)(?=###|\n##|$)', re.DOTALL)
+_RE_APPROACH = re.compile(r'\*\*Approach\*\*:\s*(.+?)(?=\n\n|\*\*Key Design Decisions\*\*|$)', re.DOTALL)
+_RE_KEY_DECISIONS_BLOCK = re.compile(r'\*\*Key Design Decisions\*\*:\n(.+?)(?=###|\n##|$)', re.DOTALL)
+_RE_KEY_DECISION = re.compile(r'\d+\.\s+\*\*((?:(?!\n\d+\.).)+?)\*\*:\s+(.+?)(?=\n\d+\.|\n###|\n##|$)', re.DOTALL)
+_RE_COMPONENTS_SECTION = re.compile(r'### 2\.2 Components(.+?)(?=\n### |\n## |$)', re.DOTALL)
+_RE_COMPONENT = re.compile(r'-\s+\*\*Component \d+\*\*:\s+([^\n]+?)\n(.+?)(?=\n-\s+\*\*Component|\n###|\n##|$)', re.DOTALL)
+_RE_DATA_STRUCTURES_SECTION = re.compile(r'### 2\.3 Data Structures\n(.+?)(?=###|\n##|$)', re.DOTALL)
+_RE_YAML_BLOCK = re.compile(r'```(?:yaml)?\n(.+?)\n```', re.DOTALL)
+_RE_APIS_SECTION = re.compile(r'### 2\.4 APIs / Interfaces\n(.+?)(?=###|\n##|$)', re.DOTALL)
+_RE_BASH_BLOCK = re.compile(r'```bash\n(.+?)\n```', re.DOTALL)
+_RE_DEPENDENCIES_SECTION = re.compile(r'### 2\.5 Dependencies\n.+?\n\n(.+?)(?=###|\n##|$)', re.DOTALL)
+_RE_DEPENDENCY = re.compile(r'-\s+\*\*(.+?)\*\*\s+(.+?)\s+-\s+(.+?)(?=\n-|\n###|\n##|$)')
+_RE_SECURITY_SECTION = re.compile(r'### 2\.6 Security Considerations\n(.+?)(?=###|\n##|$)', re.DOTALL)
+_RE_SECURITY_ITEM = re.compile(r'-\s+\*\*(.+?)\*\*:\s+(.+?)(?=\n-|\n###|\n##|$)')
+_RE_PERFORMANCE_SECTION = re.compile(r'### 2\.7 Performance Considerations\n(.+?)(?=###|\n##|$)', re.DOTALL)
+_RE_PERFORMANCE_ITEM = re.compile(r'-\s+\*\*(.+?)\*\*:\s+(.+?)(?=\n-|\n###|\n##|$)')
+
+# 3.x Implementation Plan
+_RE_TASKS_SECTION = re.compile(r'### 3\.1 Task Breakdown(.+?)(?=\n### |\n## |$)', re.DOTALL)
+_RE_TASK = re.compile(r'#### ([^\n]+?)\n(.+?)(?=\n####|\n###|\n##|$)', re.DOTALL)
+_RE_SEQUENCE_SECTION = re.compile(r'### 3\.2 Execution Sequence(.+?)(?=\n### |\n## |$)', re.DOTALL)
+_RE_STAGE = re.compile(r'\*\*(Parallel Stage|Sequential Stage) \d+\*\*:\s+([^\n]+)')
+_RE_STAGE_TASK_SEP = re.compile(r'\s*\+\s*')
+_RE_RISKS_SECTION = re.compile(r'### 3\.3 Risk Assessment(.+?)(?=\n### |\n## |$)', re.DOTALL)
+
+# 4.x Test Strategy
+_RE_TEST_CASES_SECTION = re.compile(r'### 4\.1 Test Cases(.+?)(?=\n### |\n## |$)', re.DOTALL)
+_RE_TEST_CASE = re.compile(r'#### ([^\n]+?)\n(.+?)(?=\n####|\n###|\n##|$)', re.DOTALL)
+_RE_TEST_TYPES_SECTION = re.compile(r'### 4\.2 Test Types(.+?)(?=\n### |\n## |$)', re.DOTALL)
+_RE_TEST_TYPE_CATEGORIES = tuple(
+    (category, re.compile(rf'-\s+\*\*{category}\*\*:\n(.+?)(?=\n-\s+\*\*|\n###|\n##|$)', re.DOTALL))
+    for category in ("Unit Tests", "Integration Tests", "End-to-End Tests", "Performance Tests")
+)
+_RE_TEST_TYPE_ITEM = re.compile(r'(?:^|\n)\s+-\s+\[([x ])\]\s+(.+?)(?=\n\s+-\s+\[|$)', re.DOTALL)
+_RE_CHECKLIST_SECTION = re.compile(r'### 4\.3 Validation Checklist\n.+?\n\n(.+?)(?=###|\n##|$)', re.DOTALL)
+_RE_CHECKLIST_ITEM = re.compile(r'-\s+\[([x ])\]\s+(.+?)(?=\n-|\n###|\n##|$)')
+
+# Linkages
+# An annotation runs from its marker to the next "- **Field**" item or heading
+_RE_LINKS_TO = re.compile(r'\*\*Links to\*\*:\s*\n?\s*-?\s*')
+_RE_LINKS_ITEM_END = re.compile(r'\n-\s+\*\*')
+_RE_LINK_REF = re.compile(r'([A-Za-z]+-\d+|\[\d+\.\d+\.[\w-]+\]|task-\d+|tc-\d+)')
+
+
+@lru_cache(maxsize=128)
+def _field_patterns(field_name: str) -> Tuple[Pattern[str], Pattern[str], Pattern[str]]:
+    """Compiled (backtick, plain line, checkbox) patterns for a '- **Field**:' entry."""
+    prefix = rf'-\s+\*\*{field_name}\*\*:\s+'
+    return (
+        re.compile(prefix + r'`(.+?)`'),
+        re.compile(prefix + r'([^\n]+)'),
+        re.compile(prefix + r'\[([x ])\]'),
+    )
+
+
 class ParseError(Exception):
     """Raised when parsing fails due to invalid or missing sections."""
     pass
@@ -38,44 +125,112 @@ def parse_spec(file_path: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Spec file not found: {file_path}")
     
-    content = path.read_text(encoding='utf-8')
+    return parse_spec_text(_read_spec(path), file_path)
+
+
+def parse_spec_text(content: str, file_path: str = "<string>") -> Dict[str, Any]:
+    """
+    Parse Markdown spec text already read into memory.
+    
+    Args:
+        content: Spec text with newlines normalized to "\\n"
+        file_path: Path reported in error messages
+        
+    Returns:
+        Dict matching ParsedSpec structure with all sections
+        
+    Raises:
+        ParseError: If required sections are missing or malformed
+    """
+    sections = _split_sections(content)
     
     # Parse all sections
     parsed = {
         "metadata": _parse_metadata(content, file_path),
-        "goals": _parse_goals(content),
-        "design": _parse_design(content),
-        "implementation": _parse_implementation(content),
-        "test_strategy": _parse_test_strategy(content)
+        "goals": _parse_goals(content, sections),
+        "design": _parse_design(content, sections),
+        "implementation": _parse_implementation(content, sections),
+        "test_strategy": _parse_test_strategy(content, sections)
     }
     
     return parsed
 
 
+def _read_spec(path: Path) -> str:
+    """Read a spec as text with universal newlines, like Path.read_text()."""
+    if path.stat().st_size <= _MMAP_THRESHOLD:
+        return path.read_text(encoding='utf-8')
+    
+    # Decode from the mapping directly, skipping the intermediate bytes copy
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        content = str(mm, 'utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _group_span(match: "re.Match[str]", group: int = 1) -> Tuple[str, int, int]:
+    """
+    (string, pos, endpos) arguments that confine a pattern's search to one
+    group of match, without copying the group out of the document.
+    """
+    return match.string, match.start(group), match.end(group)
+
+
+def _split_sections(content: str) -> Dict[str, int]:
+    """
+    Map each numbered subsection ("1.1", "2.3", ...) to the offset of its
+    heading in content, in a single pass. The first occurrence wins.
+    """
+    sections: Dict[str, int] = {}
+    for heading in _RE_SUBSECTION_HEADING.finditer(content):
+        sections.setdefault(heading.group(1), heading.start())
+    return sections
+
+
+def _search_section(
+    pattern: Pattern[str],
+    content: str,
+    sections: Dict[str, int],
+    number: str
+) -> Optional["re.Match[str]"]:
+    """
+    Run a subsection pattern starting at that subsection's heading.
+
+    The end is left open: the pattern's own lookahead decides where the
+    subsection stops, exactly as when searching the whole document.
+    """
+    start = sections.get(number)
+    if start is None:
+        return None
+    return pattern.search(content, start)
+
+
 def _parse_metadata(content: str, file_path: str) -> Dict[str, str]:
     """Extract metadata from frontmatter (Created, Updated, Status, Spec ID)."""
     metadata = {}
     
     # Spec ID (required)
-    spec_id_match = re.search(r'\*\*Spec ID\*\*:\s*(.+)', content)
+    spec_id_match = _RE_SPEC_ID.search(content)
     if not spec_id_match:
         raise ParseError(f"Missing required metadata: Spec ID in {file_path}")
     metadata["spec_id"] = spec_id_match.group(1).strip()
     
     # Created date (required)
-    created_match = re.search(r'\*\*Created\*\*:\s*(.+)', content)
+    created_match = _RE_CREATED.search(content)
     if not created_match:
         raise ParseError(f"Missing required metadata: Created date in {file_path}")
     metadata["created"] = created_match.group(1).strip()
     
     # Updated date (required)
-    updated_match = re.search(r'\*\*Updated\*\*:\s*(.+)', content)
+    updated_match = _RE_UPDATED.search(content)
     if not updated_match:
         raise ParseError(f"Missing required metadata: Updated date in {file_path}")
     metadata["updated"] = updated_match.group(1).strip()
     
     # Status (required)
-    status_match = re.search(r'\*\*Status\*\*:\s*(.+)', content)
+    status_match = _RE_STATUS.search(content)
     if not status_match:
         raise ParseError(f"Missing required metadata: Status in {file_path}")
     metadata["status"] = status_match.group(1).strip()
@@ -83,7 +238,7 @@ def _parse_metadata(content: str, file_path: str) -> Dict[str, str]:
     return metadata
 
 
-def _parse_goals(content: str) -> Dict[str, Any]:
+def _parse_goals(content: str, sections: Dict[str, int]) -> Dict[str, Any]:
     """Extract Goals & Requirements section (1.x)."""
     goals = {
         "primary": "",
@@ -94,24 +249,14 @@ def _parse_goals(content: str) -> Dict[str, Any]:
     }
     
     # Primary Goal (1.1)
-    primary_match = re.search(
-        r'### 1\.1 Primary Goal(.+?)(?=\n### |\n## |$)',
-        content,
-        re.DOTALL
-    )
+    primary_match = _search_section(_RE_PRIMARY_GOAL_SECTION, content, sections, "1.1")
     if primary_match:
         goals["primary"] = primary_match.group(1).strip()
     
     # User Stories (1.2)
-    user_stories_match = re.search(
-        r'### 1\.2 User Stories(.+?)(?=\n### |\n## |$)',
-        content,
-        re.DOTALL
-    )
+    user_stories_match = _search_section(_RE_USER_STORIES_SECTION, content, sections, "1.2")
     if user_stories_match:
-        stories_text = user_stories_match.group(1)
-        story_pattern = r'-\s+\*\*As an? (.+?)\*\*,\s+\*\*I want\*\*\s+(.+?),\s+\*\*so that\*\*\s+(.+?)(?=\n-|\n###|\n##|$)'
-        for match in re.finditer(story_pattern, stories_text, re.DOTALL):
+        for match in _RE_USER_STORY.finditer(*_group_span(user_stories_match)):
             goals["user_stories"].append({
                 "role": match.group(1).strip(),
                 "capability": match.group(2).strip(),
@@ -119,16 +264,10 @@ def _parse_goals(content: str) -> Dict[str, Any]:
             })
     
     # Acceptance Criteria (1.3)
-    ac_match = re.search(
-        r'### 1\.3 Acceptance Criteria\n.+?\n\n(.+?)(?=###|\n##|$)',
-        content,
-        re.DOTALL
-    )
+    ac_match = _search_section(_RE_ACCEPTANCE_SECTION, content, sections, "1.3")
     if ac_match:
-        ac_text = ac_match.group(1)
         # Pattern: - [ ] **AC-1**: Description
-        ac_pattern = r'-\s+\[([x ])\]\s+\*\*([A-Z]+-\d+)\*\*:\s+(.+?)(?=\n-|\n###|\n##|$)'
-        for match in re.finditer(ac_pattern, ac_text, re.DOTALL):
+        for match in _RE_ACCEPTANCE_ITEM.finditer(*_group_span(ac_match)):
             status = "completed" if match.group(1).strip() == "x" else "pending"
             criterion_text = match.group(3).strip()
             
@@ -144,33 +283,21 @@ def _parse_goals(content: str) -> Dict[str, Any]:
             })
     
     # Success Metrics (1.4)
-    metrics_match = re.search(
-        r'### 1\.4 Success Metrics\n.+?\n\n(.+?)(?=\n### |\n## |$)',
-        content,
-        re.DOTALL
-    )
+    metrics_match = _search_section(_RE_METRICS_SECTION, content, sections, "1.4")
     if metrics_match:
-        metrics_text = metrics_match.group(1)
-        metric_pattern = r'-\s+(.+?)(?:\n(?=-)|$)'
-        for match in re.finditer(metric_pattern, metrics_text):
+        for match in _RE_METRIC_ITEM.finditer(*_group_span(metrics_match)):
             goals["success_metrics"].append(match.group(1).strip())
     
     # Out of Scope (1.5)
-    oos_match = re.search(
-        r'### 1\.5 Out of Scope\n.+?\n\n(.+?)(?=\n### |\n## |\n---|$)',
-        content,
-        re.DOTALL
-    )
+    oos_match = _search_section(_RE_OUT_OF_SCOPE_SECTION, content, sections, "1.5")
     if oos_match:
-        oos_text = oos_match.group(1)
-        oos_pattern = r'-\s+(.+?)(?:\n(?=-)|$)'
-        for match in re.finditer(oos_pattern, oos_text):
+        for match in _RE_OUT_OF_SCOPE_ITEM.finditer(*_group_span(oos_match)):
             goals["out_of_scope"].append(match.group(1).strip())
     
     return goals
 
 
-def _parse_design(content: str) -> Dict[str, Any]:
+def _parse_design(content: str, sections: Dict[str, int]) -> Dict[str, Any]:
     """Extract Technical Design section (2.x)."""
     design = {
         "architecture": {"overview": "", "key_decisions": []},
@@ -183,41 +310,27 @@ def _parse_design(content: str) -> Dict[str, Any]:
     }
     
     # Architecture Overview (2.1)
-    arch_match = re.search(
-        r'### 2\.1 Architecture Overview\n(.+?)(?=###|\n##|$)',
-        content,
-        re.DOTALL
-    )
+    arch_match = _search_section(_RE_ARCHITECTURE_SECTION, content, sections, "2.1")
     if arch_match:
-        arch_text = arch_match.group(1)
-        
         # Extract overview (before "Key Design Decisions")
-        overview_match = re.search(r'\*\*Approach\*\*:\s*(.+?)(?=\n\n|\*\*Key Design Decisions\*\*|$)', arch_text, re.DOTALL)
+        overview_match = _RE_APPROACH.search(*_group_span(arch_match))
         if overview_match:
             design["architecture"]["overview"] = overview_match.group(1).strip()
         
         # Extract key decisions
-        decisions_match = re.search(r'\*\*Key Design Decisions\*\*:\n(.+?)(?=###|\n##|$)', arch_text, re.DOTALL)
+        decisions_match = _RE_KEY_DECISIONS_BLOCK.search(*_group_span(arch_match))
         if decisions_match:
-            decisions_text = decisions_match.group(1)
-            decision_pattern = r'\d+\.\s+\*\*(.+?)\*\*:\s+(.+?)(?=\n\d+\.|\n###|\n##|$)'
-            for match in re.finditer(decision_pattern, decisions_text, re.DOTALL):
+            for match in _RE_KEY_DECISION.finditer(*_group_span(decisions_match)):
                 design["architecture"]["key_decisions"].append({
                     "decision": match.group(1).strip(),
                     "rationale": match.group(2).strip()
                 })
     
     # Components (2.2)
-    components_match = re.search(
-        r'### 2\.2 Components(.+?)(?=\n### |\n## |$)',
-        content,
-        re.DOTALL
-    )
+    components_match = _search_section(_RE_COMPONENTS_SECTION, content, sections, "2.2")
     if components_match:
-        components_text = components_match.group(1)
         # Pattern: - **Component N**: Name
-        component_pattern = r'-\s+\*\*Component \d+\*\*:\s+(.+?)\n(.+?)(?=\n-\s+\*\*Component|\n###|\n##|$)'
-        for match in re.finditer(component_pattern, components_text, re.DOTALL):
+        for match in _RE_COMPONENT.finditer(*_group_span(components_match)):
             component_name = match.group(1).strip()
             component_details = match.group(2).strip()
 
@@ -233,46 +346,28 @@ def _parse_design(content: str) -> Dict[str, Any]:
             design["components"].append(component)
     
     # Data Structures (2.3)
-    data_structures_match = re.search(
-        r'### 2\.3 Data Structures\n(.+?)(?=###|\n##|$)',
-        content,
-        re.DOTALL
-    )
+    data_structures_match = _search_section(_RE_DATA_STRUCTURES_SECTION, content, sections, "2.3")
     if data_structures_match:
-        ds_text = data_structures_match.group(1)
         # Extract YAML/code block data structures
-        code_block_pattern = r'```(?:yaml)?\n(.+?)\n```'
-        for match in re.finditer(code_block_pattern, ds_text, re.DOTALL):
+        for match in _RE_YAML_BLOCK.finditer(*_group_span(data_structures_match)):
             design["data_structures"].append({
                 "definition": match.group(1).strip()
             })
     
     # APIs / Interfaces (2.4)
-    apis_match = re.search(
-        r'### 2\.4 APIs / Interfaces\n(.+?)(?=###|\n##|$)',
-        content,
-        re.DOTALL
-    )
+    apis_match = _search_section(_RE_APIS_SECTION, content, sections, "2.4")
     if apis_match:
-        apis_text = apis_match.group(1)
         # Extract code blocks (bash examples)
-        code_block_pattern = r'```bash\n(.+?)\n```'
-        for match in re.finditer(code_block_pattern, apis_text, re.DOTALL):
+        for match in _RE_BASH_BLOCK.finditer(*_group_span(apis_match)):
             design["apis"].append({
                 "example": match.group(1).strip()
             })
     
     # Dependencies (2.5)
-    deps_match = re.search(
-        r'### 2\.5 Dependencies\n.+?\n\n(.+?)(?=###|\n##|$)',
-        content,
-        re.DOTALL
-    )
+    deps_match = _search_section(_RE_DEPENDENCIES_SECTION, content, sections, "2.5")
     if deps_match:
-        deps_text = deps_match.group(1)
         # Pattern: - **name** version - reason
-        dep_pattern = r'-\s+\*\*(.+?)\*\*\s+(.+?)\s+-\s+(.+?)(?=\n-|\n###|\n##|$)'
-        for match in re.finditer(dep_pattern, deps_text):
+        for match in _RE_DEPENDENCY.finditer(*_group_span(deps_match)):
             design["dependencies"].append({
                 "name": match.group(1).strip(),
                 "version": match.group(2).strip(),
@@ -281,30 +376,18 @@ def _parse_design(content: str) -> Dict[str, Any]:
             })
     
     # Security Considerations (2.6)
-    security_match = re.search(
-        r'### 2\.6 Security Considerations\n(.+?)(?=###|\n##|$)',
-        content,
-        re.DOTALL
-    )
+    security_match = _search_section(_RE_SECURITY_SECTION, content, sections, "2.6")
     if security_match:
-        security_text = security_match.group(1)
-        security_pattern = r'-\s+\*\*(.+?)\*\*:\s+(.+?)(?=\n-|\n###|\n##|$)'
-        for match in re.finditer(security_pattern, security_text):
+        for match in _RE_SECURITY_ITEM.finditer(*_group_span(security_match)):
             design["security_considerations"].append({
                 "concern": match.group(1).strip(),
                 "mitigation": match.group(2).strip()
             })
     
     # Performance Considerations (2.7)
-    performance_match = re.search(
-        r'### 2\.7 Performance Considerations\n(.+?)(?=###|\n##|$)',
-        content,
-        re.DOTALL
-    )
+    performance_match = _search_section(_RE_PERFORMANCE_SECTION, content, sections, "2.7")
     if performance_match:
-        perf_text = performance_match.group(1)
-        perf_pattern = r'-\s+\*\*(.+?)\*\*:\s+(.+?)(?=\n-|\n###|\n##|$)'
-        for match in re.finditer(perf_pattern, perf_text):
+        for match in _RE_PERFORMANCE_ITEM.finditer(*_group_span(performance_match)):
             design["performance_considerations"].append({
                 "metric": match.group(1).strip(),
                 "target": match.group(2).strip()
@@ -313,7 +396,7 @@ def _parse_design(content: str) -> Dict[str, Any]:
     return design
 
 
-def _parse_implementation(content: str) -> Dict[str, Any]:
+def _parse_implementation(content: str, sections: Dict[str, int]) -> Dict[str, Any]:
     """Extract Implementation Plan section (3.x)."""
     implementation = {
         "tasks": [],
@@ -322,16 +405,10 @@ def _parse_implementation(content: str) -> Dict[str, Any]:
     }
     
     # Tasks (3.1)
-    tasks_match = re.search(
-        r'### 3\.1 Task Breakdown(.+?)(?=\n### |\n## |$)',
-        content,
-        re.DOTALL
-    )
+    tasks_match = _search_section(_RE_TASKS_SECTION, content, sections, "3.1")
     if tasks_match:
-        tasks_text = tasks_match.group(1)
         # Pattern: #### Task N: Name
-        task_pattern = r'#### (.+?)\n(.+?)(?=\n####|\n###|\n##|$)'
-        for match in re.finditer(task_pattern, tasks_text, re.DOTALL):
+        for match in _RE_TASK.finditer(*_group_span(tasks_match)):
             task_name = match.group(1).strip()
             task_details = match.group(2).strip()
             
@@ -350,50 +427,45 @@ def _parse_implementation(content: str) -> Dict[str, Any]:
             implementation["tasks"].append(task)
     
     # Execution Sequence (3.2)
-    sequence_match = re.search(
-        r'### 3\.2 Execution Sequence(.+?)(?=\n### |\n## |$)',
-        content,
-        re.DOTALL
-    )
+    sequence_match = _search_section(_RE_SEQUENCE_SECTION, content, sections, "3.2")
     if sequence_match:
-        sequence_text = sequence_match.group(1)
         # Extract stages from text (simple parsing)
-        stage_pattern = r'\*\*(Parallel Stage|Sequential Stage) \d+\*\*:\s+([^\n]+)'
-        for match in re.finditer(stage_pattern, sequence_text):
+        for match in _RE_STAGE.finditer(*_group_span(sequence_match)):
             stage_type = "parallel" if "Parallel" in match.group(1) else "sequential"
             tasks_text = match.group(2).strip()
             implementation["execution_sequence"].append({
                 "stage": stage_type,
-                "tasks": [t.strip() for t in re.split(r'\s*\+\s*', tasks_text)]
+                "tasks": [t.strip() for t in _RE_STAGE_TASK_SEP.split(tasks_text)]
             })
     
     # Risks (3.3)
-    risks_match = re.search(
-        r'### 3\.3 Risk Assessment(.+?)(?=\n### |\n## |$)',
-        content,
-        re.DOTALL
-    )
+    risks_match = _search_section(_RE_RISKS_SECTION, content, sections, "3.3")
     if risks_match:
         risks_text = risks_match.group(1)
         # Table format: | Risk | Impact | Probability | Mitigation |
-        risk_pattern = r'\|\s*(.+?)\s*\|\s*(.+?)\s*\|\s*(.+?)\s*\|\s*(.+?)\s*\|'
-        for match in re.finditer(risk_pattern, risks_text):
+        for line in risks_text.splitlines():
+            line = line.strip()
+            if not line.startswith('|'):
+                continue
+            cells = [cell.strip() for cell in line.strip('|').split('|')]
+            if len(cells) < 4:
+                continue
             # Skip table header and separator
-            risk_text = match.group(1).strip()
+            risk_text = cells[0]
             if risk_text == "Risk" or risk_text.startswith("---"):
                 continue
             implementation["risks"].append({
                 "risk": risk_text,
-                "impact": match.group(2).strip(),
-                "probability": match.group(3).strip(),
-                "mitigation": match.group(4).strip(),
+                "impact": cells[1],
+                "probability": cells[2],
+                "mitigation": cells[3],
                 "status": "identified"
             })
     
     return implementation
 
 
-def _parse_test_strategy(content: str) -> Dict[str, Any]:
+def _parse_test_strategy(content: str, sections: Dict[str, int]) -> Dict[str, Any]:
     """Extract Test Strategy section (4.x)."""
     test_strategy = {
         "test_cases": [],
@@ -402,16 +474,10 @@ def _parse_test_strategy(content: str) -> Dict[str, Any]:
     }
     
     # Test Cases (4.1)
-    test_cases_match = re.search(
-        r'### 4\.1 Test Cases(.+?)(?=\n### |\n## |$)',
-        content,
-        re.DOTALL
-    )
+    test_cases_match = _search_section(_RE_TEST_CASES_SECTION, content, sections, "4.1")
     if test_cases_match:
-        tc_text = test_cases_match.group(1)
         # Pattern: #### Test Case N: Name
-        tc_pattern = r'#### (.+?)\n(.+?)(?=\n####|\n###|\n##|$)'
-        for match in re.finditer(tc_pattern, tc_text, re.DOTALL):
+        for match in _RE_TEST_CASE.finditer(*_group_span(test_cases_match)):
             tc_name = match.group(1).strip()
             tc_details = match.group(2).strip()
             
@@ -430,24 +496,17 @@ def _parse_test_strategy(content: str) -> Dict[str, Any]:
             test_strategy["test_cases"].append(test_case)
     
     # Test Types (4.2)
-    test_types_match = re.search(
-        r'### 4\.2 Test Types(.+?)(?=\n### |\n## |$)',
-        content,
-        re.DOTALL
-    )
+    test_types_match = _search_section(_RE_TEST_TYPES_SECTION, content, sections, "4.2")
     if test_types_match:
-        tt_text = test_types_match.group(1)
         # Extract test type categories with checkboxes
-        type_categories = ["Unit Tests", "Integration Tests", "End-to-End Tests", "Performance Tests"]
-        for category in type_categories:
-            category_pattern = rf'-\s+\*\*{category}\*\*:\n(.+?)(?=\n-\s+\*\*|\n###|\n##|$)'
-            category_match = re.search(category_pattern, tt_text, re.DOTALL)
+        for category, category_re in _RE_TEST_TYPE_CATEGORIES:
+            category_match = category_re.search(*_group_span(test_types_match))
             if category_match:
                 tests_text = category_match.group(1)
                 # Match both bulleted items with checkboxes and without
-                checkbox_pattern = r'(?:^|\n)\s+-\s+\[([x ])\]\s+(.+?)(?=\n\s+-\s+\[|$)'
+                # (needs its own string: '^' only matches at a real start)
                 tests = []
-                for checkbox_match in re.finditer(checkbox_pattern, tests_text, re.DOTALL):
+                for checkbox_match in _RE_TEST_TYPE_ITEM.finditer(tests_text):
                     status = "completed" if checkbox_match.group(1).strip() == "x" else "pending"
                     test_text = checkbox_match.group(2).strip()
                     # Remove trailing newlines and extra whitespace
@@ -460,15 +519,9 @@ def _parse_test_strategy(content: str) -> Dict[str, Any]:
                 test_strategy["test_types"][category_key] = tests
     
     # Validation Checklist (4.3)
-    checklist_match = re.search(
-        r'### 4\.3 Validation Checklist\n.+?\n\n(.+?)(?=###|\n##|$)',
-        content,
-        re.DOTALL
-    )
+    checklist_match = _search_section(_RE_CHECKLIST_SECTION, content, sections, "4.3")
     if checklist_match:
-        checklist_text = checklist_match.group(1)
-        checkbox_pattern = r'-\s+\[([x ])\]\s+(.+?)(?=\n-|\n###|\n##|$)'
-        for match in re.finditer(checkbox_pattern, checklist_text):
+        for match in _RE_CHECKLIST_ITEM.finditer(*_group_span(checklist_match)):
             status = "completed" if match.group(1).strip() == "x" else "pending"
             test_strategy["validation_checklist"].append({
                 "check": match.group(2).strip(),
@@ -480,34 +533,45 @@ def _parse_test_strategy(content: str) -> Dict[str, Any]:
 
 def _extract_linkages(text: str) -> List[str]:
     """Extract linkage references from 'Links to:' annotations."""
-    linkages = []
+    # Most items carry no annotation; a substring test rejects them without
+    # starting the regex engine
+    if '**Links to**:' not in text:
+        return []
     
     # Pattern: Links to: [AC-1, TC-2] or Links to: [Goals: AC-1]
-    links_pattern = r'\*\*Links to\*\*:\s*\n?\s*-?\s*(.+?)(?=\n-\s+\*\*|\n###|\n##|\n####|$)'
-    links_match = re.search(links_pattern, text, re.DOTALL)
-    
-    if links_match:
-        links_text = links_match.group(1).strip()
-        # Extract individual references
-        # Pattern matches: AC-1, tc-2, [2.2.Component-1], task-1, etc.
-        ref_pattern = r'([A-Za-z]+-\d+|\[\d+\.\d+\.[\w-]+\]|task-\d+|tc-\d+)'
-        for ref_match in re.finditer(ref_pattern, links_text):
-            linkages.append(ref_match.group(1).strip('[]'))
-    
-    return linkages
+    links_match = _RE_LINKS_TO.search(text)
+    if not links_match:
+        return []
+    
+    # Bound the annotation with plain searches rather than a lazy group that
+    # tries every terminator at each character
+    start = links_match.end()
+    end = text.find('\n##', start + 1)
+    if end == -1:
+        end = len(text)
+    item_end = _RE_LINKS_ITEM_END.search(text, start + 1, end)
+    if item_end:
+        end = item_end.start()
+    
+    # Extract individual references
+    # Pattern matches: AC-1, tc-2, [2.2.Component-1], task-1, etc.
+    return [ref.strip('[]') for ref in _RE_LINK_REF.findall(text, start, end)]
 
 
 def _extract_field(text: str, field_name: str) -> str:
     """Extract single field value (e.g., 'ID: task-1')."""
+    # Items list only some fields; skip the regex engine for absent ones
+    if f'**{field_name}**:' not in text:
+        return ""
+    backtick_re, line_re, _ = _field_patterns(field_name)
+
     # Try with backticks first
-    pattern = rf'-\s+\*\*{field_name}\*\*:\s+`(.+?)`'
-    match = re.search(pattern, text)
+    match = backtick_re.search(text)
     if match:
         return match.group(1).strip()
 
     # Try without backticks (match until newline)
-    pattern = rf'-\s+\*\*{field_name}\*\*:\s+([^\n]+)'
-    match = re.search(pattern, text)
+    match = line_re.search(text)
     if match:
         return match.group(1).strip()
 
@@ -516,8 +580,9 @@ def _extract_field(text: str, field_name: str) -> str:
 
 def _extract_list_field(text: str, field_name: str) -> List[str]:
     """Extract list field values (e.g., 'Files: file1.py, file2.py')."""
-    pattern = rf'-\s+\*\*{field_name}\*\*:\s+([^\n]+)'
-    match = re.search(pattern, text)
+    if f'**{field_name}**:' not in text:
+        return []
+    match = _field_patterns(field_name)[1].search(text)
     if match:
         values_text = match.group(1).strip()
         # Remove backticks and split by comma
@@ -528,15 +593,16 @@ def _extract_list_field(text: str, field_name: str) -> List[str]:
 
 def _extract_checkbox_field(text: str, field_name: str) -> str:
     """Extract checkbox status field (e.g., 'Status: [ ] Pending')."""
-    pattern = rf'-\s+\*\*{field_name}\*\*:\s+\[([x ])\]'
-    match = re.search(pattern, text)
+    if f'**{field_name}**:' not in text:
+        return "pending"
+    _, line_re, checkbox_re = _field_patterns(field_name)
+    match = checkbox_re.search(text)
     if match:
         checkbox = match.group(1).strip()
         return "completed" if checkbox == "x" else "pending"
 
     # Fallback: try without checkbox
-    fallback_pattern = rf'-\s+\*\*{field_name}\*\*:\s+([^\n]+)'
-    fallback_match = re.search(fallback_pattern, text)
+    fallback_match = line_re.search(text)
     if fallback_match:
         status_text = fallback_match.group(1).strip().lower()
         if "pending" in status_text or "[ ]" in status_text:
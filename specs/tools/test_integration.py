@@ -19,21 +19,27 @@ Task: task-4 (spec-20251023-spec-to-yaml-translator)
 Acceptance Criteria: AC-1 through AC-6
 """
 
+import re
 import unittest
 import tempfile
-import shutil
 import time
 import yaml
 from pathlib import Path
+from unittest.mock import patch
 from datetime import datetime
 import hashlib
 
 # Import all components
+import yaml_generator
 from markdown_parser import parse_spec, ParseError
-from yaml_generator import YAMLGenerator, generate_yaml, validate_schema
+from yaml_generator import YAMLGenerator, YAML_SAFE_LOADER, generate_yaml, validate_schema
 from translate_spec import translate_spec, validate_yaml_file
 
 
+# ISO 8601 UTC timestamp as written to metadata.last_sync
+_ISO8601_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z')
+
+
 class TestIntegrationEndToEnd(unittest.TestCase):
     """
     Integration tests for complete Markdown → YAML workflow.
@@ -42,18 +48,17 @@ class TestIntegrationEndToEnd(unittest.TestCase):
     validating that all components work together correctly.
     """
 
-    def setUp(self):
-        """Create temporary directory for test output files."""
-        self.test_dir = tempfile.mkdtemp()
-        self.generator = YAMLGenerator()
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        shutil.rmtree(self.test_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared output directory and generator."""
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.test_dir = tmp.name
+        cls.generator = YAMLGenerator()
 
     def _get_output_path(self, filename: str) -> str:
-        """Get path for test output file."""
-        return str(Path(self.test_dir) / filename)
+        """Get path for test output file (prefixed with the test's name)."""
+        return str(Path(self.test_dir) / f"{self._testMethodName}-{filename}")
 
     def test_tc8_integration_with_real_spec(self):
         """
@@ -85,7 +90,7 @@ class TestIntegrationEndToEnd(unittest.TestCase):
 
         # THEN: YAML is valid and parseable
         with open(output_yaml_path, 'r') as f:
-            yaml_data = yaml.safe_load(f)
+            yaml_data = yaml.load(f, Loader=YAML_SAFE_LOADER)
         self.assertIsInstance(yaml_data, dict)
 
         # THEN: Contains all required sections
@@ -318,7 +323,7 @@ python test_integration.py
 
         # Phase 3: Write and validate
         Path(output_yaml_path).write_text(yaml_string, encoding='utf-8')
-        yaml_data = yaml.safe_load(yaml_string)
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
         validate_schema(yaml_data)
 
         # THEN: All phases succeed
@@ -390,7 +395,7 @@ Minimal spec for validation.
         # WHEN: Parse and generate YAML
         parsed = parse_spec(spec_path)
         yaml_string = generate_yaml(parsed, spec_path)
-        yaml_data = yaml.safe_load(yaml_string)
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
 
         # THEN: Schema validation passes
         self.assertTrue(validate_schema(yaml_data))
@@ -510,7 +515,7 @@ Clear criteria:
         # WHEN: Translate to YAML
         parsed = parse_spec(spec_path)
         yaml_string = generate_yaml(parsed, spec_path)
-        yaml_data = yaml.safe_load(yaml_string)
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
 
         # THEN: Component links to goals
         component = yaml_data["technical_design"]["components"][0]
@@ -573,17 +578,10 @@ Test metadata tracking.
         spec_path = self._get_output_path("metadata_test.md")
         Path(spec_path).write_text(spec_content, encoding='utf-8')
 
-        # Record time before translation
-        before_time = datetime.utcnow()
-
         # WHEN: Translate to YAML
-        time.sleep(0.1)  # Ensure timestamp difference
         parsed = parse_spec(spec_path)
         yaml_string = generate_yaml(parsed, spec_path)
-        yaml_data = yaml.safe_load(yaml_string)
-
-        time.sleep(0.1)
-        after_time = datetime.utcnow()
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
 
         # THEN: Metadata section present
         self.assertIn("metadata", yaml_data)
@@ -603,7 +601,7 @@ Test metadata tracking.
         last_sync_str = metadata["last_sync"]
 
         # Validate ISO 8601 format
-        self.assertRegex(last_sync_str, r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z')
+        self.assertTrue(_ISO8601_RE.match(last_sync_str))
 
         # Parse timestamp and verify it's valid
         # Note: We can't reliably check exact timing due to async execution
@@ -652,7 +650,7 @@ Test metadata tracking.
                        f"Translation took {duration_ms:.2f}ms, expected <500ms")
 
         # THEN: Output is valid
-        yaml_data = yaml.safe_load(yaml_string)
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
         self.assertIsInstance(yaml_data, dict)
 
         print(f"✅ Performance test passed")
@@ -696,17 +694,16 @@ Criteria:
         spec_path = self._get_output_path("idempotence_spec.md")
         Path(spec_path).write_text(spec_content, encoding='utf-8')
 
-        # WHEN: Translate same spec multiple times
-        parsed1 = parse_spec(spec_path)
-        yaml1 = generate_yaml(parsed1, spec_path)
-        data1 = yaml.safe_load(yaml1)
-
-        # Wait to ensure different timestamp
-        time.sleep(0.1)
+        # WHEN: Translate same spec multiple times, one second apart
+        # (2025-10-23T10:00:00Z, then 10:00:01Z on the generator's clock)
+        with patch.object(yaml_generator, "_now", side_effect=[1761213600.0, 1761213601.0]):
+            parsed1 = parse_spec(spec_path)
+            yaml1 = generate_yaml(parsed1, spec_path)
+            data1 = yaml.load(yaml1, Loader=YAML_SAFE_LOADER)
 
-        parsed2 = parse_spec(spec_path)
-        yaml2 = generate_yaml(parsed2, spec_path)
-        data2 = yaml.safe_load(yaml2)
+            parsed2 = parse_spec(spec_path)
+            yaml2 = generate_yaml(parsed2, spec_path)
+            data2 = yaml.load(yaml2, Loader=YAML_SAFE_LOADER)
 
         # THEN: Parsed data is identical
         self.assertEqual(parsed1, parsed2)
@@ -724,14 +721,15 @@ Criteria:
 
         self.assertEqual(data1_normalized, data2_normalized)
 
-        # THEN: Timestamps are both valid (but may differ)
-        self.assertRegex(timestamp1, r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z')
-        self.assertRegex(timestamp2, r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z')
+        # THEN: Timestamps are both valid, taken from each run's clock reading
+        self.assertEqual(timestamp1, "2025-10-23T10:00:00Z")
+        self.assertEqual(timestamp2, "2025-10-23T10:00:01Z")
+        self.assertTrue(_ISO8601_RE.match(timestamp1))
+        self.assertTrue(_ISO8601_RE.match(timestamp2))
 
         # THEN: Hash-based validation (normalized)
-        generator = YAMLGenerator()
-        hash1 = generator.compute_yaml_hash(yaml1)
-        hash2 = generator.compute_yaml_hash(yaml2)
+        hash1 = self.generator.compute_yaml_hash(yaml1)
+        hash2 = self.generator.compute_yaml_hash(yaml2)
 
         # Hashes will differ due to timestamp, but both should be valid SHA256
         self.assertEqual(len(hash1), 64)
@@ -804,7 +802,7 @@ Criteria:
         - Invalid enum values
         - Schema validation errors
         """
-        generator = YAMLGenerator()
+        generator = self.generator
 
         # Test 1: Missing required field
         invalid_data_1 = {
@@ -887,7 +885,7 @@ Test CLI integration.
         self.assertTrue(Path(output_path).exists())
 
         # THEN: YAML is valid
-        yaml_data = yaml.safe_load(Path(output_path).read_text())
+        yaml_data = yaml.load(Path(output_path).read_text(), Loader=YAML_SAFE_LOADER)
         self.assertEqual(yaml_data["spec_id"], "spec-20251023-cli-test")
 
         # THEN: validate_yaml_file works
@@ -902,17 +900,16 @@ class TestIntegrationEdgeCases(unittest.TestCase):
     Integration tests for edge cases and boundary conditions.
     """
 
-    def setUp(self):
-        """Create temporary directory."""
-        self.test_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        shutil.rmtree(self.test_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared output directory."""
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.test_dir = tmp.name
 
     def _get_output_path(self, filename: str) -> str:
-        """Get path for test output file."""
-        return str(Path(self.test_dir) / filename)
+        """Get path for test output file (prefixed with the test's name)."""
+        return str(Path(self.test_dir) / f"{self._testMethodName}-{filename}")
 
     def test_empty_sections_handling(self):
         """
@@ -955,7 +952,7 @@ Minimal content.
 
         # Should generate valid YAML
         yaml_string = generate_yaml(parsed, spec_path)
-        yaml_data = yaml.safe_load(yaml_string)
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
 
         # Should validate
         self.assertTrue(validate_schema(yaml_data))
@@ -1000,7 +997,7 @@ Test criteria:
         # Parse and generate
         parsed = parse_spec(spec_path)
         yaml_string = generate_yaml(parsed, spec_path)
-        yaml_data = yaml.safe_load(yaml_string)
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
 
         # Verify special characters preserved
         self.assertIn("@#$%^&*()", yaml_data["goals"]["primary"])
@@ -1138,7 +1135,7 @@ Test criteria:
         self.assertLess(duration_ms, 1000, "Large spec should translate in <1s")
 
         # Verify all items parsed
-        yaml_data = yaml.safe_load(yaml_string)
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
         self.assertEqual(len(yaml_data["goals"]["user_stories"]), 50)
         self.assertEqual(len(yaml_data["goals"]["acceptance_criteria"]), 30)
         self.assertEqual(len(yaml_data["technical_design"]["components"]), 20)
@@ -1157,17 +1154,16 @@ class TestIntegrationDataIntegrity(unittest.TestCase):
     Validates that no data is lost or corrupted during translation.
     """
 
-    def setUp(self):
-        """Create temporary directory."""
-        self.test_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        shutil.rmtree(self.test_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared output directory."""
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.test_dir = tmp.name
 
     def _get_output_path(self, filename: str) -> str:
-        """Get path for test output file."""
-        return str(Path(self.test_dir) / filename)
+        """Get path for test output file (prefixed with the test's name)."""
+        return str(Path(self.test_dir) / f"{self._testMethodName}-{filename}")
 
     def test_all_metadata_fields_preserved(self):
         """Verify all metadata fields are preserved correctly."""
@@ -1189,7 +1185,7 @@ Test metadata preservation.
 
         parsed = parse_spec(spec_path)
         yaml_string = generate_yaml(parsed, spec_path)
-        yaml_data = yaml.safe_load(yaml_string)
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
 
         # All metadata fields should be preserved
         self.assertEqual(yaml_data["spec_id"], "spec-20251023-metadata-fields")
@@ -1240,7 +1236,7 @@ What we're NOT doing:
 
         parsed = parse_spec(spec_path)
         yaml_string = generate_yaml(parsed, spec_path)
-        yaml_data = yaml.safe_load(yaml_string)
+        yaml_data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
 
         goals = yaml_data["goals"]
 
@@ -1332,7 +1328,7 @@ Criteria:
         # First translation
         parsed1 = parse_spec(spec_path)
         yaml1 = generate_yaml(parsed1, spec_path)
-        data1 = yaml.safe_load(yaml1)
+        data1 = yaml.load(yaml1, Loader=YAML_SAFE_LOADER)
 
         # Normalize timestamp
         timestamp1 = data1["metadata"]["last_sync"]
@@ -1340,7 +1336,7 @@ Criteria:
 
         # "Re-translate" by generating YAML again from same parsed data
         yaml2 = generate_yaml(parsed1, spec_path)
-        data2 = yaml.safe_load(yaml2)
+        data2 = yaml.load(yaml2, Loader=YAML_SAFE_LOADER)
         data2["metadata"]["last_sync"] = "NORMALIZED"
 
         # Data should be identical (except timestamp which we normalized)
@@ -12,7 +12,9 @@ import unittest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import patch
 
+import markdown_parser
 from markdown_parser import parse_spec, ParseError
 
 
@@ -583,6 +585,63 @@ Breakdown by category:
         self.assertEqual(len(test_types["integration_tests"]), 2)
         self.assertEqual(test_types["integration_tests"][0]["status"], "completed")
     
+    def test_malformed_items_do_not_backtrack(self):
+        """Test items missing delimiters don't make later items rescan the section."""
+        spec_content = """# Spec: Malformed Stories
+
+**Created**: 2025-10-23
+**Updated**: 2025-10-23
+**Status**: draft
+**Spec ID**: spec-20251023-malformed
+
+## 1. Goals & Requirements
+
+### 1.2 User Stories
+""" + "- **As a developer**, **I want** a story without its benefit\n" * 2000 + """\
+- **As a user**, **I want** one valid story, **so that** it is still found.
+
+## 2. Technical Design
+
+### 2.1 Architecture Overview
+**Key Design Decisions**:
+""" + "1. **Decision without a colon**\n" * 2000
+        
+        file_path = self._create_test_spec(spec_content)
+        result = parse_spec(file_path)
+        
+        stories = result["goals"]["user_stories"]
+        self.assertEqual(len(stories), 1)
+        self.assertEqual(stories[0]["role"], "user")
+        self.assertEqual(result["design"]["architecture"]["key_decisions"], [])
+    
+    def test_parse_spec_via_mmap(self):
+        """Test large specs read through mmap parse the same as small ones."""
+        spec_content = """# Spec: Mmap Test
+
+**Created**: 2025-10-23
+**Updated**: 2025-10-23
+**Status**: draft
+**Spec ID**: spec-20251023-mmap-test
+
+## 1. Goals & Requirements
+
+### 1.1 Primary Goal
+Parse large specs without an extra copy.
+
+### 1.2 User Stories
+- **As a developer**, **I want** big specs, **so that** nothing is lost.
+"""
+        file_path = os.path.join(self.test_dir, "test_spec.md")
+        Path(file_path).write_bytes(spec_content.replace("\n", "\r\n").encode("utf-8"))
+        
+        expected = parse_spec(file_path)
+        with patch.object(markdown_parser, "_MMAP_THRESHOLD", 0):
+            result = parse_spec(file_path)
+        
+        self.assertEqual(result, expected)
+        self.assertEqual(result["metadata"]["spec_id"], "spec-20251023-mmap-test")
+        self.assertEqual(len(result["goals"]["user_stories"]), 1)
+    
     def test_parse_real_spec_file(self):
         """Test parsing the actual spec file this implementation is based on."""
         # Use the real spec file path
@@ -8,9 +8,13 @@ Test Coverage:
 - tc-5: Idempotent translation (same input → same output)
 """
 
+import json
+import re
 import unittest
+from unittest.mock import patch
 import yaml
 from datetime import datetime, timezone
+import yaml_generator
 from yaml_generator import YAMLGenerator, generate_yaml, validate_schema
 
 
@@ -251,7 +255,51 @@ class TestYAMLGenerator(unittest.TestCase):
         # This demonstrates that the generator produces consistent structure
         self.assertIsInstance(hash1, str)
         self.assertEqual(len(hash1), 64)  # SHA256 hex length
-    
+
+    def test_generate_yaml_template_cache(self):
+        """Repeat generations (any generator) reuse one template matching a fresh dump."""
+        data = dict(self.sample_parsed_data)
+        data["metadata"] = {k: v for k, v in data["metadata"].items() if k != "created"}
+
+        yaml_generator._TEMPLATE_CACHE.clear()
+        yaml1 = self.generator.generate_yaml(data, self.markdown_path)
+        yaml2 = self.generator.generate_yaml(data, self.markdown_path)
+        yaml3 = generate_yaml(data, self.markdown_path)
+        self.assertEqual(len(yaml_generator._TEMPLATE_CACHE), 1)
+
+        fresh = self.generator._generate_deterministic_yaml(
+            self.generator._build_yaml_structure(data, self.markdown_path)
+        )
+        timestamp = re.compile(r"'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z'")
+        self.assertEqual(timestamp.sub("TS", yaml1), timestamp.sub("TS", fresh))
+        self.assertEqual(timestamp.sub("TS", yaml2), timestamp.sub("TS", fresh))
+        self.assertEqual(timestamp.sub("TS", yaml3), timestamp.sub("TS", fresh))
+        self.assertNotIn("__OAK_SPEC_TIMESTAMP__", yaml2)
+        self.assertIsInstance(yaml.safe_load(yaml2)["created"], str)
+
+    def test_generate_spec_returns_data(self):
+        """Test generate_spec() returns YAML text with the data it encodes."""
+        result = self.generator.generate_spec(self.sample_parsed_data, self.markdown_path)
+
+        self.assertEqual(yaml.safe_load(result.yaml_text), result.data)
+        self.assertTrue(self.generator.validate_schema(result.data))
+        self.assertEqual(result.data["metadata"]["markdown_location"], self.markdown_path)
+
+    def test_generate_json(self):
+        """Test JSON output matches the YAML document and compares by bytes."""
+        json1 = self.generator.generate_json(self.sample_parsed_data, self.markdown_path, timestamp="T")
+        json2 = self.generator.generate_json(self.sample_parsed_data, self.markdown_path, timestamp="T")
+        self.assertIsInstance(json1, bytes)
+        self.assertEqual(json1, json2)
+
+        yaml_data = yaml.safe_load(self.generator.generate_yaml(self.sample_parsed_data, self.markdown_path))
+        yaml_data["metadata"]["last_sync"] = "T"
+        self.assertEqual(json.loads(json1), yaml_data)
+
+        with patch.object(yaml_generator, "orjson", None):
+            json3 = self.generator.generate_json(self.sample_parsed_data, self.markdown_path, timestamp="T")
+        self.assertEqual(json.loads(json3), json.loads(json1))
+
     def test_validate_schema_success(self):
         """Test schema validation passes for valid YAML data."""
         yaml_string = self.generator.generate_yaml(self.sample_parsed_data, self.markdown_path)
@@ -334,7 +382,20 @@ class TestYAMLGenerator(unittest.TestCase):
         result = self.generator._format_datetime(None)
         # Should be valid ISO timestamp
         self.assertRegex(result, r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z')
-    
+
+    def test_current_timestamp_reused_briefly(self):
+        """Test current timestamp is reused within the reuse window only."""
+        start = 1761213600.0  # 2025-10-23T10:00:00Z
+        with patch.object(yaml_generator, "_now", return_value=start):
+            first = self.generator._get_current_timestamp()
+        with patch.object(yaml_generator, "_now", return_value=start + 0.25):
+            self.assertEqual(self.generator._get_current_timestamp(), first)
+        with patch.object(yaml_generator, "_now", return_value=start + 1.0):
+            later = self.generator._get_current_timestamp()
+
+        self.assertEqual(first, "2025-10-23T10:00:00Z")
+        self.assertEqual(later, "2025-10-23T10:00:01Z")
+
     def test_convenience_function_generate_yaml(self):
         """Test module-level convenience function for YAML generation."""
         yaml_string = generate_yaml(self.sample_parsed_data, self.markdown_path)
@@ -521,6 +582,32 @@ class TestYAMLGeneratorEdgeCases(unittest.TestCase):
         # Should handle long content
         self.assertEqual(len(yaml_data["linked_request"]), 10000)
 
+    def test_fast_dump_round_trip(self):
+        """Test the specialized writer loads back to the same data as PyYAML."""
+        data = {
+            "strings": ["plain", "a: b", "x #y", " lead", "trail ", "it's", "123",
+                        "yes", "null", "2025-10-23", "- dash", "", "multi\nline",
+                        "tab\there", "🚀 üñí", "line sep", "50%"],
+            "numbers": [0, -3, 1.5, 1e20, float("inf")],
+            "flags": [True, False, None],
+            "empty": {"list": [], "dict": {}},
+            "nested": [[1, [2, {}]], {"k": [{"a": 1, "b": []}], "z": {"y": "x"}}],
+            1: "int key",
+            "on": "off"
+        }
+        fast = yaml_generator._fast_dump(data)
+        self.assertEqual(yaml.safe_load(fast), data)
+        self.assertEqual(yaml.safe_load(fast), yaml.safe_load(yaml.safe_dump(data)))
+
+    def test_fast_dump_falls_back_for_other_types(self):
+        """Test documents with types outside the writer's subset use PyYAML."""
+        data = {"when": datetime(2025, 10, 23, tzinfo=timezone.utc), "tags": ("a", "b")}
+        with self.assertRaises(TypeError):
+            yaml_generator._fast_dump(data)
+
+        yaml_data = yaml.safe_load(self.generator._generate_deterministic_yaml({"when": data["when"]}))
+        self.assertEqual(yaml_data["when"], data["when"])
+
 
 if __name__ == "__main__":
     unittest.main()
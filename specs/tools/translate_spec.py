@@ -23,14 +23,17 @@ Usage:
 """
 
 import argparse
+import copy
+import hashlib
 import sys
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 # Import parser and generator
-from markdown_parser import parse_spec, ParseError
-from yaml_generator import generate_yaml, validate_schema, YAMLGenerator
+from markdown_parser import parse_spec_text, ParseError
+from yaml_generator import generate_spec, validate_schema, YAML_SAFE_LOADER
 
 
 class TranslationError(Exception):
@@ -38,6 +41,64 @@ class TranslationError(Exception):
     pass
 
 
+# translate_spec() reuses parse results for Markdown it has already seen,
+# keyed by source path and file content
+_PARSE_CACHE_SIZE = 256
+_PARSE_CACHE: Dict[bytes, Dict[str, Any]] = {}
+
+
+def clear_cache() -> None:
+    """Forget cached parse results, so the next translation parses again."""
+    _PARSE_CACHE.clear()
+
+
+def _parse_spec_cached(input_file: str) -> Dict[str, Any]:
+    """
+    parse_spec() that skips parsing when the file content is unchanged.
+    
+    The returned dict is shared with later calls; treat it as read-only.
+    """
+    path = Path(input_file)
+    if not path.exists():
+        raise FileNotFoundError(f"Spec file not found: {input_file}")
+    
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(input_file.encode("utf-8") + b"\0", digest_size=16)
+    digest.update(raw)
+    key = digest.digest()
+    parsed = _PARSE_CACHE.get(key)
+    if parsed is None:
+        # Universal newlines, as parse_spec() reads the file
+        content = raw.decode("utf-8")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        parsed = parse_spec_text(content, input_file)
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.clear()
+        _PARSE_CACHE[key] = parsed
+    return parsed
+
+
+def build_spec_dict(input_file: str) -> Dict[str, Any]:
+    """
+    Translate a Markdown spec to YAML document data without writing it.
+    
+    Args:
+        input_file: Path to Markdown spec file
+        
+    Returns:
+        Dictionary the YAML output of translate_spec() would encode (a copy
+        the caller may modify)
+        
+    Raises:
+        FileNotFoundError: If the Markdown file does not exist
+        ParseError: If the Markdown spec is malformed
+    """
+    # Same parse path as translate_spec(); copy because the data shares
+    # nested values with the cached parse
+    return copy.deepcopy(generate_spec(_parse_spec_cached(input_file), input_file).data)
+
+
 def translate_spec(input_file: str, output_file: str, validate: bool = False) -> bool:
     """
     Translate Markdown spec to YAML format.
@@ -56,17 +117,16 @@ def translate_spec(input_file: str, output_file: str, validate: bool = False) ->
     try:
         # Step 1: Parse Markdown
         print(f"📄 Parsing Markdown spec: {input_file}")
-        parsed_data = parse_spec(input_file)
+        parsed_data = _parse_spec_cached(input_file)
         print(f"✅ Successfully parsed {len(parsed_data)} sections")
         
         # Step 2: Generate YAML
         print(f"🔧 Generating YAML structure...")
-        yaml_string = generate_yaml(parsed_data, input_file)
+        yaml_string, yaml_data = generate_spec(parsed_data, input_file)
         
         # Step 3: Optional validation
         if validate:
             print(f"🔍 Validating YAML schema...")
-            yaml_data = yaml.safe_load(yaml_string)
             validate_schema(yaml_data)
             print(f"✅ YAML validation passed")
         
@@ -79,7 +139,7 @@ def translate_spec(input_file: str, output_file: str, validate: bool = False) ->
         print(f"📊 Metadata tracked:")
         print(f"   - Source: {input_file}")
         print(f"   - Generated: {output_file}")
-        print(f"   - Timestamp: {yaml.safe_load(yaml_string)['metadata']['last_sync']}")
+        print(f"   - Timestamp: {yaml_data['metadata']['last_sync']}")
         
         return True
         
@@ -117,7 +177,7 @@ def validate_yaml_file(yaml_file: str) -> bool:
             return False
         
         yaml_content = yaml_path.read_text(encoding='utf-8')
-        yaml_data = yaml.safe_load(yaml_content)
+        yaml_data = yaml.load(yaml_content, Loader=YAML_SAFE_LOADER)
         
         # Validate schema
         print(f"🔍 Validating YAML schema...")
@@ -164,13 +224,9 @@ def watch_markdown_file(markdown_file: str) -> None:
     sys.exit(1)
 
 
-def main() -> int:
-    """
-    Main CLI entry point.
-    
-    Returns:
-        Exit code (0 for success, 1 for failure)
-    """
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once; the grammar never changes)."""
     parser = argparse.ArgumentParser(
         description="Translate Markdown specs to YAML format",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -220,7 +276,21 @@ Examples:
         help='Validate YAML after translation'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main CLI entry point.
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
     
     # Validate argument combinations
     if args.input and not args.output:
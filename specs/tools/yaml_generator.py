@@ -9,10 +9,164 @@ Acceptance Criteria: AC-2, AC-4
 """
 
 import yaml
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, NamedTuple, Optional
 from datetime import datetime, timezone
+from functools import lru_cache
 import hashlib
 import json
+import math
+import pickle
+import re
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml C bindings when PyYAML was built with them; both are
+# safe (no arbitrary object construction) and produce the same documents.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Schema requirements checked by validate_schema() (order sets message order)
+_REQUIRED_FIELDS = ("spec_id", "created", "updated", "status", "linked_request")
+_REQUIRED_SECTIONS = ("goals", "technical_design", "implementation", "test_strategy", "metadata")
+_REQUIRED_METADATA = ("spec_version", "generated_from_markdown", "markdown_location", "last_sync")
+_VALID_STATUSES = ["draft", "approved", "in-progress", "completed"]
+# Set forms for the single-pass check of documents that are valid
+_REQUIRED_KEYS = frozenset(_REQUIRED_FIELDS + _REQUIRED_SECTIONS)
+_REQUIRED_METADATA_KEYS = frozenset(_REQUIRED_METADATA)
+
+# generate_yaml() caches the dumped document per input with this stand-in for
+# "now"; each call only substitutes the current timestamp into the template.
+# The cache is shared by all generators (keys include the spec version).
+_TIMESTAMP_PLACEHOLDER = "__OAK_SPEC_TIMESTAMP__"
+_TEMPLATE_CACHE_SIZE = 64
+_TEMPLATE_CACHE: Dict[bytes, str] = {}
+
+# Timestamps are reused for this long, so batches of generate_yaml() calls
+# share one clock read and formatting
+_TIMESTAMP_REUSE_SECONDS = 0.5
+
+# Clock behind every generated timestamp (epoch seconds); tests patch this
+_now = time.time
+
+
+class GeneratedSpec(NamedTuple):
+    """YAML text from YAMLGenerator.generate_spec() with the data it encodes."""
+    yaml_text: str
+    data: Dict[str, Any]
+
+
+# Emit spec documents with _fast_dump() instead of yaml.dump(); set to False
+# to compare against (or fall back to) the PyYAML emitter
+FAST_DUMP = True
+
+
+# Specialized writer for spec documents: block mappings and indentless
+# sequences of str/int/float/bool/None, laid out the way yaml.dump() lays out
+# the same data. Anything else raises TypeError so the caller can fall back.
+
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_PLAIN_FIRST_EXCLUDED = frozenset("-?:,[]{}#&*!|>'\"%@`")
+# Characters JSON leaves raw that YAML double-quoted scalars must escape
+_RE_YAML_UNSAFE = re.compile('[\x7f-\x9f\u2028\u2029\ufeff\ufffe\uffff\ud800-\udfff]')
+
+
+@lru_cache(maxsize=4096)
+def _fast_str(value: str) -> str:
+    """Render a string as a plain, single-quoted or double-quoted scalar."""
+    if value.isprintable():
+        if (value
+                and value[0] not in _PLAIN_FIRST_EXCLUDED
+                and value[0] != " " and value[-1] not in " :"
+                and ": " not in value and " #" not in value
+                and not value.startswith("...")
+                and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == _YAML_STR_TAG):
+            return value
+        return "'" + value.replace("'", "''") + "'"
+    # JSON string escapes are a subset of YAML double-quoted escapes
+    return _RE_YAML_UNSAFE.sub(
+        lambda m: "\\u%04x" % ord(m.group()), json.dumps(value, ensure_ascii=False)
+    )
+
+
+def _fast_scalar(value: Any) -> str:
+    """Render a scalar (or empty collection) on a single line."""
+    kind = type(value)
+    if kind is str:
+        return _fast_str(value)
+    if value is None:
+        return "null"
+    if kind is bool:
+        return "true" if value else "false"
+    if kind is int:
+        return str(value)
+    if kind is float:
+        if math.isnan(value):
+            return ".nan"
+        if math.isinf(value):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        # YAML 1.1 floats need a '.', as in SafeRepresenter.represent_float
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if kind is dict and not value:
+        return "{}"
+    if kind is list and not value:
+        return "[]"
+    raise TypeError(f"Cannot fast-dump {kind.__name__}")
+
+
+def _fast_mapping(mapping: Dict[Any, Any], indent: int, out: List[str]) -> None:
+    pad = " " * indent
+    for key, value in mapping.items():
+        key_text = _fast_scalar(key)
+        kind = type(value)
+        if kind is dict and value:
+            out.append(f"{pad}{key_text}:\n")
+            _fast_mapping(value, indent + 2, out)
+        elif kind is list and value:
+            out.append(f"{pad}{key_text}:\n")
+            _fast_sequence(value, indent, out)
+        else:
+            out.append(f"{pad}{key_text}: {_fast_scalar(value)}\n")
+
+
+def _fast_sequence(sequence: List[Any], indent: int, out: List[str]) -> None:
+    pad = " " * indent
+    for item in sequence:
+        kind = type(item)
+        if (kind is dict or kind is list) and item:
+            # Nested collection starts on the dash line, one level deeper;
+            # write it in place, then fold its first line onto the dash
+            first = len(out)
+            if kind is dict:
+                _fast_mapping(item, indent + 2, out)
+            else:
+                _fast_sequence(item, indent + 2, out)
+            out[first] = f"{pad}- {out[first][indent + 2:]}"
+        else:
+            out.append(f"{pad}- {_fast_scalar(item)}\n")
+
+
+def _fast_dump(spec: Dict[str, Any]) -> str:
+    """
+    Serialize a spec document to YAML without going through PyYAML.
+    
+    Raises:
+        TypeError: If the document holds a type outside the supported subset
+    """
+    if type(spec) is not dict:
+        raise TypeError(f"Cannot fast-dump {type(spec).__name__}")
+    if not spec:
+        return "{}\n"
+    out: List[str] = []
+    _fast_mapping(spec, 0, out)
+    return "".join(out)
 
 
 class YAMLGenerator:
@@ -29,6 +183,7 @@ class YAMLGenerator:
     def __init__(self):
         """Initialize YAML generator with schema template."""
         self.spec_version = "1.0"
+        self._time_cache = (0.0, "")
     
     def generate_yaml(self, parsed_data: Dict[str, Any], markdown_path: str) -> str:
         """
@@ -44,13 +199,54 @@ class YAMLGenerator:
         Raises:
             ValueError: If required fields are missing or invalid
         """
-        # Build complete YAML structure
-        yaml_data = self._build_yaml_structure(parsed_data, markdown_path)
+        template = self._dump_with_placeholder(parsed_data, markdown_path)
         
-        # Generate deterministic YAML output
-        yaml_string = self._generate_deterministic_yaml(yaml_data)
+        # The dumper single-quotes ISO timestamps (they match YAML's timestamp
+        # resolver), so substitute the quoted form it would have written
+        return template.replace(_TIMESTAMP_PLACEHOLDER, f"'{self._get_current_timestamp()}'")
+    
+    def generate_spec(self, parsed_data: Dict[str, Any], markdown_path: str) -> GeneratedSpec:
+        """
+        Generate YAML like generate_yaml(), also returning the document data.
         
-        return yaml_string
+        Callers that need both the text and its fields (validation, metadata)
+        use this instead of loading the YAML they just generated. The data
+        shares nested lists and dicts with parsed_data; treat both as read-only.
+        
+        Args:
+            parsed_data: Dictionary containing parsed spec sections
+            markdown_path: Path to source Markdown file
+            
+        Returns:
+            GeneratedSpec of the YAML string and the dictionary it encodes
+        """
+        timestamp = self._get_current_timestamp()
+        template = self._dump_with_placeholder(parsed_data, markdown_path)
+        yaml_data = self._build_yaml_structure(parsed_data, markdown_path, timestamp=timestamp)
+        return GeneratedSpec(template.replace(_TIMESTAMP_PLACEHOLDER, f"'{timestamp}'"), yaml_data)
+    
+    def _dump_with_placeholder(self, parsed_data: Dict[str, Any], markdown_path: str) -> str:
+        """
+        Dump the document with _TIMESTAMP_PLACEHOLDER wherever the current
+        time goes, reusing the cached dump when the input is unchanged.
+        """
+        key = hashlib.blake2b(
+            pickle.dumps((self.spec_version, FAST_DUMP, parsed_data, markdown_path), protocol=5),
+            digest_size=16
+        ).digest()
+        template = _TEMPLATE_CACHE.get(key)
+        if template is None:
+            # Build complete YAML structure, timestamps left as placeholders
+            yaml_data = self._build_yaml_structure(
+                parsed_data, markdown_path, timestamp=_TIMESTAMP_PLACEHOLDER
+            )
+            
+            # Generate deterministic YAML output
+            template = self._generate_deterministic_yaml(yaml_data)
+            if len(_TEMPLATE_CACHE) >= _TEMPLATE_CACHE_SIZE:
+                _TEMPLATE_CACHE.clear()
+            _TEMPLATE_CACHE[key] = template
+        return template
     
     def validate_schema(self, yaml_data: Dict[str, Any]) -> bool:
         """
@@ -65,45 +261,46 @@ class YAMLGenerator:
         Raises:
             ValueError: With detailed validation error message
         """
-        errors = []
-        
-        # Required top-level fields
-        required_fields = ["spec_id", "created", "updated", "status", "linked_request"]
-        for field in required_fields:
-            if field not in yaml_data:
-                errors.append(f"Missing required field: {field}")
+        # Valid documents pass a few membership checks; messages are only built on failure
+        metadata = yaml_data.get("metadata")
+        if (
+            _REQUIRED_KEYS <= yaml_data.keys()
+            and isinstance(metadata, dict)
+            and _REQUIRED_METADATA_KEYS <= metadata.keys()
+            and yaml_data["status"] in _VALID_STATUSES
+        ):
+            return True
         
-        # Required sections
-        required_sections = ["goals", "technical_design", "implementation", "test_strategy", "metadata"]
-        for section in required_sections:
-            if section not in yaml_data:
-                errors.append(f"Missing required section: {section}")
+        # Required top-level fields and sections
+        errors = [f"Missing required field: {field}" for field in _REQUIRED_FIELDS if field not in yaml_data]
+        errors.extend(
+            f"Missing required section: {section}" for section in _REQUIRED_SECTIONS if section not in yaml_data
+        )
         
         # Validate metadata section
-        if "metadata" in yaml_data:
-            metadata = yaml_data["metadata"]
-            if "spec_version" not in metadata:
-                errors.append("Missing metadata.spec_version")
-            if "generated_from_markdown" not in metadata:
-                errors.append("Missing metadata.generated_from_markdown")
-            if "markdown_location" not in metadata:
-                errors.append("Missing metadata.markdown_location")
-            if "last_sync" not in metadata:
-                errors.append("Missing metadata.last_sync")
+        if metadata is not None:
+            errors.extend(f"Missing metadata.{key}" for key in _REQUIRED_METADATA if key not in metadata)
         
         # Validate status enum
-        if "status" in yaml_data:
-            valid_statuses = ["draft", "approved", "in-progress", "completed"]
-            if yaml_data["status"] not in valid_statuses:
-                errors.append(f"Invalid status: {yaml_data['status']} (must be one of {valid_statuses})")
+        if "status" in yaml_data and yaml_data["status"] not in _VALID_STATUSES:
+            errors.append(f"Invalid status: {yaml_data['status']} (must be one of {_VALID_STATUSES})")
         
         if errors:
             raise ValueError("YAML validation failed:\n" + "\n".join(f"  - {e}" for e in errors))
         
         return True
     
-    def _build_yaml_structure(self, parsed_data: Dict[str, Any], markdown_path: str) -> Dict[str, Any]:
-        """Build complete YAML structure from parsed data."""
+    def _build_yaml_structure(
+        self,
+        parsed_data: Dict[str, Any],
+        markdown_path: str,
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build complete YAML structure from parsed data.
+        
+        timestamp, if given, is used wherever the current time would be.
+        """
         # Extract metadata from parsed data
         metadata_section = parsed_data.get("metadata", {})
         
@@ -111,8 +308,8 @@ class YAMLGenerator:
         yaml_data = {
             # Top-level metadata
             "spec_id": metadata_section.get("spec_id", "spec-unknown"),
-            "created": self._format_datetime(metadata_section.get("created")),
-            "updated": self._format_datetime(metadata_section.get("updated")),
+            "created": self._format_datetime(metadata_section.get("created"), timestamp),
+            "updated": self._format_datetime(metadata_section.get("updated"), timestamp),
             "status": metadata_section.get("status", "draft"),
             "linked_request": metadata_section.get("linked_request", ""),
             
@@ -159,7 +356,7 @@ class YAMLGenerator:
             },
             
             # Section 8: Metadata
-            "metadata": self._build_metadata_section(markdown_path)
+            "metadata": self._build_metadata_section(markdown_path, timestamp)
         }
         
         return yaml_data
@@ -210,13 +407,13 @@ class YAMLGenerator:
             "validation_checklist": test_data.get("validation_checklist", [])
         }
     
-    def _build_metadata_section(self, markdown_path: str) -> Dict[str, Any]:
+    def _build_metadata_section(self, markdown_path: str, last_sync: Optional[str] = None) -> Dict[str, Any]:
         """Build metadata section with tracking information."""
         return {
             "spec_version": self.spec_version,
             "generated_from_markdown": True,
             "markdown_location": markdown_path,
-            "last_sync": self._get_current_timestamp(),
+            "last_sync": last_sync or self._get_current_timestamp(),
             "statistics": {
                 "total_tasks": 0,
                 "completed_tasks": 0,
@@ -227,10 +424,10 @@ class YAMLGenerator:
             }
         }
     
-    def _format_datetime(self, dt: Optional[Any]) -> str:
-        """Format datetime to ISO 8601 string."""
+    def _format_datetime(self, dt: Optional[Any], default: Optional[str] = None) -> str:
+        """Format datetime to ISO 8601 string (default/current time if unset)."""
         if dt is None:
-            return self._get_current_timestamp()
+            return default or self._get_current_timestamp()
         
         if isinstance(dt, str):
             # Already formatted, return as-is
@@ -243,11 +440,16 @@ class YAMLGenerator:
             return dt.isoformat().replace("+00:00", "Z")
         
         # Fallback to current timestamp
-        return self._get_current_timestamp()
+        return default or self._get_current_timestamp()
     
     def _get_current_timestamp(self) -> str:
-        """Get current timestamp in ISO 8601 format."""
-        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        """Get current timestamp in ISO 8601 format (reused for up to 0.5s)."""
+        now = _now()
+        cached_at, timestamp = self._time_cache
+        if not 0.0 <= now - cached_at < _TIMESTAMP_REUSE_SECONDS:
+            timestamp = datetime.fromtimestamp(now, timezone.utc).isoformat().replace("+00:00", "Z")
+            self._time_cache = (now, timestamp)
+        return timestamp
     
     def _generate_deterministic_yaml(self, yaml_data: Dict[str, Any]) -> str:
         """
@@ -257,13 +459,23 @@ class YAMLGenerator:
         - Sorted keys for consistent output
         - Same input always produces same output
         - Security: Uses safe_dump (no code execution)
+        
+        Uses _fast_dump() when FAST_DUMP is set, falling back to PyYAML for
+        documents holding other types (e.g. datetime objects).
         """
-        # Use safe_dump for security (no arbitrary code execution)
+        if FAST_DUMP:
+            try:
+                return _fast_dump(yaml_data)
+            except TypeError:
+                pass
+        
+        # Use the safe dumper for security (no arbitrary code execution)
         # sort_keys=False to preserve logical ordering (we pre-order the dict)
         # default_flow_style=False for readable multi-line format
         # allow_unicode=True for proper unicode handling
-        yaml_string = yaml.safe_dump(
+        yaml_string = yaml.dump(
             yaml_data,
+            Dumper=YAML_SAFE_DUMPER,
             default_flow_style=False,
             sort_keys=False,  # We control order via dict construction
             allow_unicode=True,
@@ -273,6 +485,34 @@ class YAMLGenerator:
         
         return yaml_string
     
+    def generate_json(
+        self,
+        parsed_data: Dict[str, Any],
+        markdown_path: str,
+        timestamp: Optional[str] = None
+    ) -> bytes:
+        """
+        Generate the same document as generate_yaml() as compact JSON.
+        
+        Keys are sorted, so equal documents give equal bytes and can be
+        compared directly without parsing.
+        
+        Args:
+            parsed_data: Dictionary containing parsed spec sections
+            markdown_path: Path to source Markdown file
+            timestamp: Value to use instead of the current time (pin it to
+                       compare two generations byte for byte)
+            
+        Returns:
+            UTF-8 encoded JSON
+        """
+        yaml_data = self._build_yaml_structure(parsed_data, markdown_path, timestamp=timestamp)
+        if orjson is not None:
+            return orjson.dumps(yaml_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            yaml_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+    
     def compute_yaml_hash(self, yaml_string: str) -> str:
         """
         Compute hash of YAML content for idempotency validation.
@@ -284,13 +524,17 @@ class YAMLGenerator:
             SHA256 hash of normalized YAML content
         """
         # Normalize by parsing and re-dumping (eliminates formatting differences)
-        data = yaml.safe_load(yaml_string)
-        normalized = yaml.safe_dump(data, sort_keys=True)
+        data = yaml.load(yaml_string, Loader=YAML_SAFE_LOADER)
+        normalized = yaml.dump(data, Dumper=YAML_SAFE_DUMPER, sort_keys=True)
         
         # Compute SHA256 hash
         return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
 
 
+# Shared instance behind the module-level convenience functions
+_default_generator = YAMLGenerator()
+
+
 def generate_yaml(parsed_data: Dict[str, Any], markdown_path: str) -> str:
     """
     Convenience function for YAML generation.
@@ -302,8 +546,21 @@ def generate_yaml(parsed_data: Dict[str, Any], markdown_path: str) -> str:
     Returns:
         YAML string formatted according to SPEC_SCHEMA.yaml
     """
-    generator = YAMLGenerator()
-    return generator.generate_yaml(parsed_data, markdown_path)
+    return _default_generator.generate_yaml(parsed_data, markdown_path)
+
+
+def generate_spec(parsed_data: Dict[str, Any], markdown_path: str) -> GeneratedSpec:
+    """
+    Convenience function for YAML generation that also returns the data.
+    
+    Args:
+        parsed_data: Dictionary containing parsed spec sections
+        markdown_path: Path to source Markdown file
+        
+    Returns:
+        GeneratedSpec of the YAML string and the dictionary it encodes
+    """
+    return _default_generator.generate_spec(parsed_data, markdown_path)
 
 
 def validate_schema(yaml_data: Dict[str, Any]) -> bool:
@@ -319,5 +576,4 @@ def validate_schema(yaml_data: Dict[str, Any]) -> bool:
     Raises:
         ValueError: If validation fails
     """
-    generator = YAMLGenerator()
-    return generator.validate_schema(yaml_data)
+    return _default_generator.validate_schema(yaml_data)
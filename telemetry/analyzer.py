@@ -7,9 +7,16 @@ Analyzes logged telemetry data and generates performance statistics.
 
 import json
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
+
+try:
+    # Optional C-accelerated parser for the JSONL load paths
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 class TelemetryAnalyzer:
@@ -40,7 +47,7 @@ class TelemetryAnalyzer:
         with open(self.invocations_file, "r") as f:
             for line in f:
                 if line.strip():
-                    invocations.append(json.loads(line))
+                    invocations.append(_json_loads(line))
         return invocations
 
     def load_metrics(self) -> List[Dict[str, Any]]:
@@ -52,7 +59,7 @@ class TelemetryAnalyzer:
         with open(self.metrics_file, "r") as f:
             for line in f:
                 if line.strip():
-                    metrics.append(json.loads(line))
+                    metrics.append(_json_loads(line))
         return metrics
 
     def generate_statistics(self) -> Dict[str, Any]:
@@ -148,7 +155,7 @@ class TelemetryAnalyzer:
             for tt in stats["task_types"]:
                 task_type_counts[tt] += 1
             common_task_types = sorted(
-                task_type_counts.items(), key=lambda x: x[1], reverse=True
+                task_type_counts.items(), key=itemgetter(1), reverse=True
             )[:3]
 
             final_stats["agents"][agent_name] = {
@@ -196,7 +203,7 @@ class TelemetryAnalyzer:
             task_type_counts[tt] += 1
 
         if task_type_counts:
-            most_common = max(task_type_counts.items(), key=lambda x: x[1])
+            most_common = max(task_type_counts.items(), key=itemgetter(1))
             if most_common[1] >= 3:  # At least 3 instances
                 recommendations.append(f"Best for {most_common[0]} tasks")
 
@@ -286,7 +293,7 @@ class TelemetryAnalyzer:
             rankings.append((agent_name, score, agent_stats))
 
         # Sort by score descending
-        rankings.sort(key=lambda x: x[1], reverse=True)
+        rankings.sort(key=itemgetter(1), reverse=True)
 
         return rankings
 
@@ -346,7 +353,7 @@ class TelemetryAnalyzer:
         with open(self.workflow_events_file, "r") as f:
             for line in f:
                 if line.strip():
-                    events.append(json.loads(line))
+                    events.append(_json_loads(line))
         return events
 
     def analyze_workflows(self) -> Dict[str, Any]:
@@ -432,7 +439,7 @@ class TelemetryAnalyzer:
 
         most_common_patterns = sorted(
             pattern_counts.items(),
-            key=lambda x: x[1],
+            key=itemgetter(1),
             reverse=True
         )[:5]
 
@@ -547,62 +554,78 @@ class TelemetryAnalyzer:
             - recent_success_rate: Success rate in last 7 days
             - historical_success_rate: Success rate in prior period
         """
-        invocations = self.load_invocations()
+        return self.get_agent_performance_trends_bulk([agent_name], days)[agent_name]
 
-        if not invocations:
-            return {
-                "trend": "insufficient_data",
-                "success_rate_change": 0.0,
-                "recent_success_rate": 0.0,
-                "historical_success_rate": 0.0
-            }
+    def get_agent_performance_trends_bulk(
+        self,
+        agent_names: Iterable[str],
+        days: int = 30
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze performance trends for several agents in one pass over the log.
 
-        # Filter invocations for this agent
-        agent_invocations = [
-            inv for inv in invocations
-            if inv.get("agent_name") == agent_name
-        ]
+        Args:
+            agent_names: Names of agents to analyze
+            days: Number of days to look back
 
-        if len(agent_invocations) < 2:
-            return {
-                "trend": "insufficient_data",
-                "success_rate_change": 0.0,
-                "recent_success_rate": 0.0,
-                "historical_success_rate": 0.0
-            }
+        Returns:
+            Dictionary mapping each agent name to the same trend dictionary
+            returned by get_agent_performance_trends()
+        """
+        # Per-agent counters: total, recent, recent successes, historical, historical successes
+        counters = {name: [0, 0, 0, 0, 0] for name in agent_names}
 
         # Calculate cutoff timestamps (ensure timezone aware)
-        from datetime import timezone
         now = datetime.now(timezone.utc)
-        recent_cutoff = now - __import__("datetime").timedelta(days=7)
-        historical_cutoff = now - __import__("datetime").timedelta(days=days)
+        recent_cutoff = now - timedelta(days=7)
+        historical_cutoff = now - timedelta(days=days)
+
+        for inv in self.load_invocations():
+            counter = counters.get(inv.get("agent_name"))
+            if counter is None:
+                continue
 
-        # Split into recent and historical
-        recent_invocations = []
-        historical_invocations = []
+            counter[0] += 1
 
-        for inv in agent_invocations:
+            # Split into recent and historical
             try:
                 timestamp = datetime.fromisoformat(inv["timestamp"].replace("Z", "+00:00"))
-                if timestamp >= recent_cutoff:
-                    recent_invocations.append(inv)
-                elif timestamp >= historical_cutoff:
-                    historical_invocations.append(inv)
             except (ValueError, KeyError):
                 continue
 
-        # Calculate success rates
-        def calc_success_rate(invocations_list):
-            if not invocations_list:
-                return 0.0
-            successes = sum(
-                1 for inv in invocations_list
-                if inv.get("outcome", {}).get("status") == "success"
-            )
-            return successes / len(invocations_list)
+            success = inv.get("outcome", {}).get("status") == "success"
+            if timestamp >= recent_cutoff:
+                counter[1] += 1
+                counter[2] += success
+            elif timestamp >= historical_cutoff:
+                counter[3] += 1
+                counter[4] += success
+
+        return {
+            name: self._summarize_trend(*counter)
+            for name, counter in counters.items()
+        }
 
-        recent_rate = calc_success_rate(recent_invocations)
-        historical_rate = calc_success_rate(historical_invocations)
+    @staticmethod
+    def _summarize_trend(
+        total: int,
+        recent: int,
+        recent_successes: int,
+        historical: int,
+        historical_successes: int
+    ) -> Dict[str, Any]:
+        """Turn per-agent trend counters into a trend dictionary."""
+        if total < 2:
+            return {
+                "trend": "insufficient_data",
+                "success_rate_change": 0.0,
+                "recent_success_rate": 0.0,
+                "historical_success_rate": 0.0
+            }
+
+        # Calculate success rates
+        recent_rate = recent_successes / recent if recent else 0.0
+        historical_rate = historical_successes / historical if historical else 0.0
 
         # Determine trend
         rate_change = recent_rate - historical_rate
@@ -5,8 +5,13 @@ Telemetry Logger for Claude OaK Agents
 This module provides utilities for logging agent invocations and success metrics.
 """
 
+import atexit
 import json
 import os
+import queue
+import shutil
+import tempfile
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -16,13 +21,23 @@ from typing import Dict, List, Optional, Any
 class TelemetryLogger:
     """Handles logging of agent invocations and success metrics."""
 
-    def __init__(self, telemetry_dir: Optional[Path] = None):
+    # Maximum number of queued appends coalesced into one writev()
+    WRITE_BATCH_SIZE = 256
+
+    # Queue sentinel that tells the background writer to exit
+    _STOP = object()
+
+    def __init__(self, telemetry_dir: Optional[Path] = None, async_writes: bool = False):
         """
         Initialize the telemetry logger.
 
         Args:
             telemetry_dir: Directory to store telemetry files.
                           Defaults to ./telemetry relative to this file.
+            async_writes: Queue appends to a background writer thread that
+                          coalesces them into one writev() + fsync() per file
+                          per batch. Call flush() before reading the files
+                          and close() when done with the logger.
         """
         if telemetry_dir is None:
             telemetry_dir = Path(__file__).parent
@@ -41,6 +56,136 @@ class TelemetryLogger:
         # Session ID persists for the lifetime of this logger instance
         self.session_id = str(uuid.uuid4())
 
+        # Background writer state (only used when async_writes=True)
+        self.async_writes = async_writes
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._write_error: Optional[OSError] = None
+
+    def _append(self, path: Path, record: Dict[str, Any]) -> None:
+        """Append one JSON record to a JSONL file (queued when async_writes is on)."""
+        line = json.dumps(record) + "\n"
+        if not self.async_writes:
+            with open(path, "a") as f:
+                f.write(line)
+            return
+
+        if self._writer_thread is None:
+            self._start_writer()
+        self._queue.put((path, line.encode("utf-8")))
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread on first use."""
+        with self._writer_lock:
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="telemetry-writer", daemon=True
+                )
+                self._writer_thread.start()
+                atexit.register(self.close)
+
+    def _writer_loop(self) -> None:
+        """Drain queued appends and write each batch with one writev() per file."""
+        while True:
+            items = [self._queue.get()]
+            try:
+                while len(items) < self.WRITE_BATCH_SIZE:
+                    items.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            # Group lines per file, preserving queue order within each file
+            batches: Dict[Path, List[bytes]] = {}
+            flush_events = []
+            stop = False
+            for item in items:
+                if item is self._STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    flush_events.append(item)
+                else:
+                    batches.setdefault(item[0], []).append(item[1])
+
+            try:
+                for path, buffers in batches.items():
+                    try:
+                        self._write_batch(path, buffers)
+                    except OSError as e:
+                        # Keep the writer alive; flush() re-raises the first error
+                        if self._write_error is None:
+                            self._write_error = e
+            finally:
+                for event in flush_events:
+                    event.set()
+
+            if stop:
+                return
+
+    @staticmethod
+    def _write_batch(path: Path, buffers: List[bytes]) -> None:
+        """Append buffers to path with writev(), finishing any short write."""
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            written = os.writev(fd, buffers)
+            if written < sum(len(b) for b in buffers):
+                rest = memoryview(b"".join(buffers))[written:]
+                while rest:
+                    rest = rest[os.write(fd, rest):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _raise_write_error(self) -> None:
+        """Re-raise (once) the first error hit by the background writer."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued append has been written.
+
+        A no-op for synchronous loggers or before anything was queued.
+
+        Returns:
+            False if the timeout expired before the queue was drained
+
+        Raises:
+            OSError: The first write error hit by the background writer
+                     since the last flush; the failed batch was dropped.
+        """
+        if self._writer_thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        drained = done.wait(timeout)
+        self._raise_write_error()
+        return drained
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write everything queued, then stop the background writer thread.
+
+        Also drops the atexit hook registered when the writer started. A
+        later async append starts a new writer.
+
+        Returns:
+            False if the timeout expired before the writer finished
+
+        Raises:
+            OSError: As for flush()
+        """
+        with self._writer_lock:
+            thread, self._writer_thread = self._writer_thread, None
+            if thread is None:
+                return True
+            atexit.unregister(self.close)
+            self._queue.put(self._STOP)
+        thread.join(timeout)
+        self._raise_write_error()
+        return not thread.is_alive()
+
     def log_invocation(
         self,
         agent_name: str,
@@ -87,7 +232,48 @@ class TelemetryLogger:
         """
         invocation_id = str(uuid.uuid4())
 
-        invocation_data = {
+        invocation_data = self._build_invocation(
+            invocation_id=invocation_id,
+            agent_name=agent_name,
+            agent_type=agent_type,
+            task_description=task_description,
+            state_features=state_features,
+            parent_invocation_id=parent_invocation_id,
+            workflow_id=workflow_id,
+            spec_id=spec_id,
+            spec_section=spec_section,
+            metadata=metadata,
+            agent_variant=agent_variant,
+            task_type=task_type,
+            q_value=q_value,
+            exploration=exploration,
+            learning_enabled=learning_enabled
+        )
+
+        self._append(self.invocations_file, invocation_data)
+
+        return invocation_id
+
+    def _build_invocation(
+        self,
+        invocation_id: str,
+        agent_name: str,
+        agent_type: str,
+        task_description: str,
+        state_features: Optional[Dict[str, Any]] = None,
+        parent_invocation_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        spec_id: Optional[str] = None,
+        spec_section: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        agent_variant: Optional[str] = None,
+        task_type: Optional[str] = None,
+        q_value: Optional[float] = None,
+        exploration: Optional[bool] = None,
+        learning_enabled: bool = False
+    ) -> Dict[str, Any]:
+        """Build a new invocation record. See log_invocation for the fields."""
+        return {
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "session_id": self.session_id,
             "invocation_id": invocation_id,
@@ -120,10 +306,37 @@ class TelemetryLogger:
             "metadata": metadata or {}
         }
 
-        with open(self.invocations_file, "a") as f:
-            f.write(json.dumps(invocation_data) + "\n")
+    def log_invocations_batch(self, invocations: List[Dict[str, Any]]) -> List[str]:
+        """
+        Log several agent invocations with a single append.
 
-        return invocation_id
+        Each entry takes the same keyword arguments as log_invocation and may
+        also carry a pre-generated "invocation_id" (useful when later entries
+        in the batch reference earlier ones via parent_invocation_id). All
+        records are written in one writev() (completed if short) followed
+        by one fsync().
+
+        Args:
+            invocations: List of log_invocation keyword-argument dicts
+
+        Returns:
+            List of invocation IDs, in the same order as the input
+        """
+        # Keep queued single appends ahead of this batch
+        self.flush()
+
+        invocation_ids = []
+        lines = []
+        for kwargs in invocations:
+            kwargs = dict(kwargs)
+            invocation_id = kwargs.pop("invocation_id", None) or str(uuid.uuid4())
+            invocation_ids.append(invocation_id)
+            lines.append(json.dumps(self._build_invocation(invocation_id, **kwargs)) + "\n")
+
+        if lines:
+            self._write_batch(self.invocations_file, ["".join(lines).encode("utf-8")])
+
+        return invocation_ids
 
     def update_invocation(
         self,
@@ -156,8 +369,40 @@ class TelemetryLogger:
             build_succeeded: Whether build succeeded
             reward: Calculated reward signal for CRL (CRL Phase 1, optional)
         """
+        self.update_invocations_batch([{
+            "invocation_id": invocation_id,
+            "duration_seconds": duration_seconds,
+            "outcome_status": outcome_status,
+            "error_message": error_message,
+            "files_modified": files_modified,
+            "files_created": files_created,
+            "tools_used": tools_used,
+            "tests_passed": tests_passed,
+            "build_succeeded": build_succeeded,
+            "reward": reward
+        }])
+
+    def update_invocations_batch(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Apply several invocation updates with a single read and rewrite.
+
+        Each entry takes the same keyword arguments as update_invocation
+        ("invocation_id" is required). The log is read once, every update is
+        applied, and the file is rewritten once.
+
+        Args:
+            updates: List of update_invocation keyword-argument dicts
+
+        Raises:
+            ValueError: If any invocation ID is not found (nothing is written)
+        """
+        # Queued appends must reach the file before it is read and rewritten
+        self.flush()
+
+        pending: Dict[str, List[Dict[str, Any]]] = {}
+        for update in updates:
+            pending.setdefault(update["invocation_id"], []).append(update)
         invocations = []
-        updated = False
 
         # Read all invocations
         with open(self.invocations_file, "r") as f:
@@ -165,38 +410,65 @@ class TelemetryLogger:
                 if line.strip():
                     invocations.append(json.loads(line))
 
-        # Update the matching invocation
+        # Update the matching invocations
         for inv in invocations:
-            if inv["invocation_id"] == invocation_id:
-                if duration_seconds is not None:
-                    inv["duration_seconds"] = duration_seconds
-                if outcome_status is not None:
-                    inv["outcome"]["status"] = outcome_status
-                if error_message is not None:
-                    inv["outcome"]["error_message"] = error_message
-                if files_modified is not None:
-                    inv["outcome"]["files_modified"] = files_modified
-                if files_created is not None:
-                    inv["outcome"]["files_created"] = files_created
-                if tools_used is not None:
-                    inv["tools_used"] = tools_used
-                if tests_passed is not None:
-                    inv["outcome"]["tests_passed"] = tests_passed
-                if build_succeeded is not None:
-                    inv["outcome"]["build_succeeded"] = build_succeeded
-                # CRL Phase 1: Update reward
-                if reward is not None:
-                    inv["reward"] = reward
-                updated = True
-                break
-
-        if not updated:
-            raise ValueError(f"Invocation ID {invocation_id} not found")
-
-        # Rewrite the file
-        with open(self.invocations_file, "w") as f:
-            for inv in invocations:
-                f.write(json.dumps(inv) + "\n")
+            for update in pending.pop(inv["invocation_id"], ()):
+                self._apply_update(inv, **update)
+
+        if pending:
+            raise ValueError(f"Invocation ID {next(iter(pending))} not found")
+
+        # Rewrite via a unique temp file so concurrent readers never see a
+        # truncated log and concurrent writers never share the temp file
+        fd, tmp_file = tempfile.mkstemp(
+            dir=self.invocations_file.parent,
+            prefix=self.invocations_file.name + ".",
+            suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                for inv in invocations:
+                    f.write(json.dumps(inv) + "\n")
+            shutil.copymode(self.invocations_file, tmp_file)
+            os.replace(tmp_file, self.invocations_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.unlink(tmp_file)
+
+    @staticmethod
+    def _apply_update(
+        inv: Dict[str, Any],
+        invocation_id: str,
+        duration_seconds: Optional[float] = None,
+        outcome_status: Optional[str] = None,
+        error_message: Optional[str] = None,
+        files_modified: Optional[List[str]] = None,
+        files_created: Optional[List[str]] = None,
+        tools_used: Optional[List[str]] = None,
+        tests_passed: Optional[bool] = None,
+        build_succeeded: Optional[bool] = None,
+        reward: Optional[float] = None
+    ) -> None:
+        """Apply completion fields to an invocation record in place."""
+        if duration_seconds is not None:
+            inv["duration_seconds"] = duration_seconds
+        if outcome_status is not None:
+            inv["outcome"]["status"] = outcome_status
+        if error_message is not None:
+            inv["outcome"]["error_message"] = error_message
+        if files_modified is not None:
+            inv["outcome"]["files_modified"] = files_modified
+        if files_created is not None:
+            inv["outcome"]["files_created"] = files_created
+        if tools_used is not None:
+            inv["tools_used"] = tools_used
+        if tests_passed is not None:
+            inv["outcome"]["tests_passed"] = tests_passed
+        if build_succeeded is not None:
+            inv["outcome"]["build_succeeded"] = build_succeeded
+        # CRL Phase 1: Update reward
+        if reward is not None:
+            inv["reward"] = reward
 
     def log_success_metric(
         self,
@@ -234,8 +506,7 @@ class TelemetryLogger:
             "alternative_agent_suggested": alternative_agent_suggested
         }
 
-        with open(self.metrics_file, "a") as f:
-            f.write(json.dumps(metric_data) + "\n")
+        self._append(self.metrics_file, metric_data)
 
     def get_session_id(self) -> str:
         """Return the current session ID."""
@@ -267,8 +538,7 @@ class TelemetryLogger:
             "estimated_duration": estimated_duration
         }
 
-        with open(self.workflow_events_file, "a") as f:
-            f.write(json.dumps(workflow_data) + "\n")
+        self._append(self.workflow_events_file, workflow_data)
 
     def log_agent_handoff(
         self,
@@ -296,8 +566,7 @@ class TelemetryLogger:
             "artifacts": artifacts
         }
 
-        with open(self.workflow_events_file, "a") as f:
-            f.write(json.dumps(handoff_data) + "\n")
+        self._append(self.workflow_events_file, handoff_data)
 
     def log_workflow_complete(
         self,
@@ -325,8 +594,7 @@ class TelemetryLogger:
             "agents_executed": agents_executed
         }
 
-        with open(self.workflow_events_file, "a") as f:
-            f.write(json.dumps(complete_data) + "\n")
+        self._append(self.workflow_events_file, complete_data)
 
 
 def main():
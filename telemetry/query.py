@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Workflow Query Tool for Claude OaK Agents
+
+Looks up agent invocations by workflow_id. This is the implementation
+behind scripts/query_workflow.sh and can also be used in-process.
+
+Usage:
+    python -m telemetry.query <workflow_id>
+    python -m telemetry.query --list-today    # List today's workflows
+    python -m telemetry.query --list-all      # List all workflows
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+def iter_invocations(invocations_file: Path) -> Iterator[Dict[str, Any]]:
+    """Yield invocation records from a JSONL file, skipping blank lines."""
+    with open(invocations_file, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def query_workflow(
+    workflow_id: str,
+    records: Iterable[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Return the invocations belonging to a workflow, in input order.
+
+    Args:
+        workflow_id: Workflow to look up
+        records: Any iterable of invocation records (file iterator, index, ...)
+    """
+    return [r for r in records if r.get("workflow_id") == workflow_id]
+
+
+def list_workflow_ids(
+    records: Iterable[Dict[str, Any]],
+    date_prefix: Optional[str] = None
+) -> List[str]:
+    """
+    Return the sorted, unique workflow IDs in the records.
+
+    Args:
+        records: Invocation records
+        date_prefix: Only include records whose timestamp starts with this
+                     (e.g. "2025-10-24")
+    """
+    return sorted({
+        r["workflow_id"]
+        for r in records
+        if r.get("workflow_id") is not None
+        and (date_prefix is None or str(r.get("timestamp", "")).startswith(date_prefix))
+    })
+
+
+def format_workflow_table(invocations: List[Dict[str, Any]]) -> str:
+    """Format invocations as aligned TIMESTAMP/AGENT/STATUS/DURATION rows."""
+    rows = [
+        [
+            str(inv.get("timestamp") or ""),
+            str(inv.get("agent_name") or ""),
+            str((inv.get("outcome") or {}).get("status") or ""),
+            "" if inv.get("duration_seconds") is None else str(inv["duration_seconds"])
+        ]
+        for inv in invocations
+    ]
+    if not rows:
+        return ""
+    widths = [max(len(row[i]) for row in rows) for i in range(4)]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point (mirrors scripts/query_workflow.sh)."""
+    argv = sys.argv[1:] if argv is None else argv
+    prog = "query_workflow.sh"
+
+    if not argv or not argv[0]:
+        print(f"Usage: {prog} <workflow_id>")
+        print(f"       {prog} --list-today    # List today's workflows")
+        print(f"       {prog} --list-all      # List all workflows")
+        return 1
+
+    telemetry_file = Path(os.environ.get("OAK_TELEMETRY_DIR") or "telemetry") / "agent_invocations.jsonl"
+    if not telemetry_file.is_file():
+        print(f"Error: Telemetry file not found at {telemetry_file}")
+        return 1
+
+    arg = argv[0]
+    if arg == "--list-today":
+        today = datetime.now().strftime("%Y-%m-%d")
+        print(f"Workflows from {today}:")
+        print()
+        for workflow_id in list_workflow_ids(iter_invocations(telemetry_file), today):
+            print(workflow_id)
+    elif arg == "--list-all":
+        print("All workflows:")
+        print()
+        for workflow_id in list_workflow_ids(iter_invocations(telemetry_file)):
+            print(workflow_id)
+    else:
+        print(f"Workflow: {arg}")
+        print()
+        print("TIMESTAMP\tAGENT\tSTATUS\tDURATION")
+        table = format_workflow_table(query_workflow(arg, iter_invocations(telemetry_file)))
+        if table:
+            print(table)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,8 @@ import sys
 import json
 import tempfile
 import shutil
+import subprocess
+import time
 from pathlib import Path
 from typing import Dict, Any
 
@@ -24,7 +26,11 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 try:
-    from skills.artifacts_builder import ArtifactBuilderSkill, invoke_artifact_skill
+    from skills.artifacts_builder import (
+        ArtifactBuilderSkill,
+        _stream_command,
+        invoke_artifact_skill,
+    )
 except ImportError:
     print("⚠️  skills.artifacts_builder not importable - tests will be limited")
     ArtifactBuilderSkill = None
@@ -324,6 +330,24 @@ class TestArtifactWorkflow:
 
         return all_passed
 
+    def test_script_timeout(self):
+        """Test 8: Script timeout is enforced even if a grandchild holds the pipe."""
+        if ArtifactBuilderSkill is None:
+            self.log_test("Script timeout", False, "Skill not available")
+            return False
+
+        start = time.monotonic()
+        try:
+            _stream_command(["bash", "-c", "sleep 10 & wait"], self.temp_dir, 1)
+        except subprocess.TimeoutExpired:
+            elapsed = time.monotonic() - start
+            passed = elapsed < 5
+            self.log_test("Script timeout", passed, f"Timed out after {elapsed:.1f}s")
+            return passed
+
+        self.log_test("Script timeout", False, "TimeoutExpired not raised")
+        return False
+
     def run_all_tests(self):
         """Run all integration tests."""
         print("\n" + "=" * 80)
@@ -341,6 +365,7 @@ class TestArtifactWorkflow:
             self.test_design_guidelines_detection()
             self.test_workflow_integration()
             self.test_quality_gate_artifact_checks()
+            self.test_script_timeout()
 
         finally:
             self.teardown()
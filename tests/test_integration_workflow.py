@@ -6,8 +6,10 @@ Tests the complete integration of Phase 2 workflow tracking with existing OaK in
 """
 
 import json
+import os
 import sys
 import tempfile
+import threading
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -245,6 +247,37 @@ class TestIntegratedWorkflow(unittest.TestCase):
         self.assertGreaterEqual(trend_data["recent_success_rate"], 0.0)
         self.assertLessEqual(trend_data["recent_success_rate"], 1.0)
 
+    def test_agent_performance_trends_bulk(self):
+        """Test bulk trend analysis matches per-agent analysis."""
+        for agent_name, statuses in [
+            ("agent-a", ["success", "success", "failure"]),
+            ("agent-b", ["failure", "success"]),
+            ("agent-c", ["success"]),
+        ]:
+            for status in statuses:
+                inv_id = self.logger.log_invocation(
+                    agent_name=agent_name,
+                    agent_type="test",
+                    task_description="Bulk trend task"
+                )
+                self.logger.update_invocation(
+                    invocation_id=inv_id,
+                    duration_seconds=100,
+                    outcome_status=status
+                )
+
+        names = ["agent-a", "agent-b", "agent-c", "agent-missing"]
+        bulk = self.analyzer.get_agent_performance_trends_bulk(names, days=30)
+
+        self.assertEqual(set(bulk), set(names))
+        for agent_name in names:
+            self.assertEqual(
+                bulk[agent_name],
+                self.analyzer.get_agent_performance_trends(agent_name, days=30)
+            )
+        self.assertEqual(bulk["agent-c"]["trend"], "insufficient_data")
+        self.assertAlmostEqual(bulk["agent-a"]["recent_success_rate"], 0.667)
+
     def test_query_best_agent_integration(self):
         """Test agent recommendation query using isolated telemetry."""
         # This test verifies the query mechanism works correctly
@@ -338,6 +371,183 @@ class TestIntegratedWorkflow(unittest.TestCase):
         invocations = self.analyzer.load_invocations()
         self.assertEqual(len(invocations), 1)
 
+    def test_invocation_batches(self):
+        """Test batch logging and batch updates match the per-call API."""
+        inv_ids = self.logger.log_invocations_batch([
+            {
+                "invocation_id": "batch-parent",
+                "agent_name": "backend-architect",
+                "agent_type": "development",
+                "task_description": "Design API",
+                "workflow_id": "test-wf-batch"
+            },
+            {
+                "agent_name": "unit-test-expert",
+                "agent_type": "quality",
+                "task_description": "Write tests",
+                "parent_invocation_id": "batch-parent",
+                "workflow_id": "test-wf-batch"
+            }
+        ])
+        self.assertEqual(inv_ids[0], "batch-parent")
+        self.assertEqual(len(inv_ids), 2)
+
+        self.logger.update_invocations_batch([
+            {"invocation_id": inv_id, "duration_seconds": 60, "outcome_status": "success"}
+            for inv_id in inv_ids
+        ])
+
+        invocations = self.analyzer.load_invocations()
+        self.assertEqual([inv["invocation_id"] for inv in invocations], inv_ids)
+        self.assertEqual(invocations[1]["parent_invocation_id"], "batch-parent")
+        self.assertTrue(all(inv["outcome"]["status"] == "success" for inv in invocations))
+
+        with self.assertRaises(ValueError):
+            self.logger.update_invocations_batch([{"invocation_id": "missing"}])
+
+    def test_batch_logging_finishes_short_writes(self):
+        """Test a short write does not truncate a batch append."""
+        real_writev = os.writev
+
+        def short_writev(fd, buffers):
+            return real_writev(fd, [buffers[0][:5]])
+
+        with patch("os.writev", short_writev):
+            inv_ids = self.logger.log_invocations_batch([
+                {"agent_name": f"agent-{i}", "agent_type": "test", "task_description": "Batch"}
+                for i in range(5)
+            ])
+
+        invocations = self.analyzer.load_invocations()
+        self.assertEqual([inv["invocation_id"] for inv in invocations], inv_ids)
+
+    def test_batch_update_rewrite(self):
+        """Test the rewrite keeps the file mode and never leaves a temp file."""
+        inv_id = self.logger.log_invocation(
+            agent_name="backend-architect",
+            agent_type="development",
+            task_description="Design API"
+        )
+        self.logger.invocations_file.chmod(0o640)
+
+        self.logger.update_invocations_batch([
+            {"invocation_id": inv_id, "outcome_status": "success"}
+        ])
+        self.assertEqual(self.logger.invocations_file.stat().st_mode & 0o777, 0o640)
+
+        with patch("os.replace", side_effect=OSError("replace failed")):
+            with self.assertRaises(OSError):
+                self.logger.update_invocations_batch([
+                    {"invocation_id": inv_id, "outcome_status": "failure"}
+                ])
+        self.assertEqual(list(self.telemetry_dir.glob("*.tmp")), [])
+        self.assertEqual(
+            self.analyzer.load_invocations()[0]["outcome"]["status"], "success"
+        )
+
+    def test_async_writes(self):
+        """Test queued appends land in order once flushed."""
+        logger = TelemetryLogger(self.telemetry_dir, async_writes=True)
+        self.addCleanup(logger.close)
+
+        inv_ids = [
+            logger.log_invocation(
+                agent_name=f"agent-{i}",
+                agent_type="test",
+                task_description="Queued write"
+            )
+            for i in range(20)
+        ]
+        logger.log_workflow_start(
+            workflow_id="test-wf-async",
+            project_name="Async",
+            agent_plan=["agent-0"]
+        )
+
+        # update_invocation flushes the queue before rewriting the file
+        logger.update_invocation(inv_ids[-1], outcome_status="success")
+        self.assertTrue(logger.close())
+
+        invocations = self.analyzer.load_invocations()
+        self.assertEqual([inv["invocation_id"] for inv in invocations], inv_ids)
+        self.assertEqual(invocations[-1]["outcome"]["status"], "success")
+        self.assertEqual(len(self.analyzer.load_workflow_events()), 1)
+
+    def test_async_writes_finish_short_writes(self):
+        """Test a short writev() is completed rather than truncating the batch."""
+        logger = TelemetryLogger(self.telemetry_dir, async_writes=True)
+        self.addCleanup(logger.close)
+        real_writev = os.writev
+
+        def short_writev(fd, buffers):
+            return real_writev(fd, [buffers[0][:5]])
+
+        with patch("os.writev", short_writev):
+            inv_ids = [
+                logger.log_invocation(
+                    agent_name=f"agent-{i}",
+                    agent_type="test",
+                    task_description="Short write"
+                )
+                for i in range(5)
+            ]
+            logger.flush()
+
+        invocations = self.analyzer.load_invocations()
+        self.assertEqual([inv["invocation_id"] for inv in invocations], inv_ids)
+
+    def test_async_write_errors_raised_from_flush(self):
+        """Test the writer reports a failed batch from flush() and keeps running."""
+        logger = TelemetryLogger(self.telemetry_dir, async_writes=True)
+        self.addCleanup(logger.close)
+        logger.invocations_file = self.telemetry_dir / "not-a-file"
+        logger.invocations_file.mkdir()
+
+        logger.log_invocation(
+            agent_name="agent-x",
+            agent_type="test",
+            task_description="Fails"
+        )
+        with self.assertRaises(OSError):
+            logger.flush()
+
+        # The error is reported once and later writes still land
+        logger.log_workflow_start(
+            workflow_id="test-wf-after-error",
+            project_name="Async",
+            agent_plan=["agent-x"]
+        )
+        logger.flush()
+        self.assertEqual(len(self.analyzer.load_workflow_events()), 1)
+
+    def test_async_flush_timeout_and_close(self):
+        """Test flush() reports a timeout and close() stops the writer."""
+        logger = TelemetryLogger(self.telemetry_dir, async_writes=True)
+        self.addCleanup(logger.close)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        real_write_batch = TelemetryLogger._write_batch
+
+        def blocked_write_batch(path, buffers):
+            release.wait()
+            real_write_batch(path, buffers)
+
+        with patch.object(TelemetryLogger, "_write_batch", staticmethod(blocked_write_batch)):
+            logger.log_invocation(
+                agent_name="agent-slow",
+                agent_type="test",
+                task_description="Blocked"
+            )
+            self.assertFalse(logger.flush(timeout=0.05))
+            release.set()
+            self.assertTrue(logger.flush())
+
+        writer = logger._writer_thread
+        self.assertTrue(logger.close())
+        self.assertFalse(writer.is_alive())
+        self.assertIsNone(logger._writer_thread)
+        self.assertEqual(len(self.analyzer.load_invocations()), 1)
+
     def test_weekly_review_integration(self):
         """Test that weekly review can handle workflow data."""
         # Create workflow data
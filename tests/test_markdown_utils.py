@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Test Markdown Utils
+
+Checks that cached frontmatter parses are not exposed to callers.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.shared.markdown_utils import get_metadata, parse_frontmatter
+
+
+def test_cached_frontmatter_not_mutated_by_callers():
+    """Mutating returned metadata must not change later results."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        agent_file = Path(tmpdir) / "agent.md"
+        agent_file.write_text(
+            "---\nname: test-agent\ntools: [Read, Write]\n---\nBody\n",
+            encoding="utf-8",
+        )
+        parse_frontmatter.cache_clear()
+
+        metadata, _ = parse_frontmatter(agent_file)
+        metadata["tools"].append("Bash")
+        metadata["name"] = "changed"
+        get_metadata(agent_file, "tools").append("Edit")
+
+        metadata, body = parse_frontmatter(agent_file)
+        assert metadata["name"] == "test-agent"
+        assert metadata["tools"] == ["Read", "Write"]
+        assert get_metadata(agent_file, "tools") == ["Read", "Write"]
+        assert body.strip() == "Body"
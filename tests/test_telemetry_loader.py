@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test Telemetry Loader
+
+Checks the fast read paths in scripts/shared/telemetry_loader.py against
+a plain full scan of the same log.
+"""
+
+import json
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.shared import telemetry_loader
+from scripts.shared.telemetry_loader import (
+    _find_window_start,
+    get_recent_invocations,
+    get_workflow_invocations,
+    load_invocations,
+)
+from telemetry.logger import TelemetryLogger
+
+
+def _write_sorted_log(telemetry_dir: Path, hours: int) -> Path:
+    """Write one invocation per hour, oldest first, with some invalid timestamps."""
+    now = datetime.utcnow()
+    lines = []
+    for h in range(hours, 0, -1):
+        inv = {"invocation_id": f"inv-{h}", "agent_name": "test-agent"}
+        if h % 7 == 0:
+            inv["timestamp"] = 12345
+        elif h % 11 == 0:
+            inv["timestamp"] = "not-a-timestamp"
+        else:
+            inv["timestamp"] = (now - timedelta(hours=h)).isoformat() + "Z"
+        lines.append(json.dumps(inv) + "\n")
+    telemetry_file = telemetry_dir / "agent_invocations.jsonl"
+    telemetry_file.write_text("".join(lines))
+    return telemetry_file
+
+
+def _ids(invocations):
+    return [inv["invocation_id"] for inv in invocations]
+
+
+def test_recent_window_inside_tail(monkeypatch):
+    """A window covering only the tail matches the full scan."""
+    monkeypatch.setattr(telemetry_loader, "_TAIL_BYTES_PER_DAY", 300)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        telemetry_dir = Path(tmpdir)
+        telemetry_file = _write_sorted_log(telemetry_dir, hours=30 * 24)
+
+        for days in (1, 3, 10):
+            assert _find_window_start(telemetry_file, days) > 0
+            recent = get_recent_invocations(telemetry_dir, days, sorted_log=True)
+            full = get_recent_invocations(telemetry_dir, days, sorted_log=False)
+            assert recent and _ids(recent) == _ids(full)
+
+
+def test_recent_window_larger_than_file(monkeypatch):
+    """A window older than the whole log falls back to reading everything."""
+    monkeypatch.setattr(telemetry_loader, "_TAIL_BYTES_PER_DAY", 300)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        telemetry_dir = Path(tmpdir)
+        telemetry_file = _write_sorted_log(telemetry_dir, hours=5 * 24)
+
+        assert _find_window_start(telemetry_file, 60) == 0
+        recent = get_recent_invocations(telemetry_dir, 60, sorted_log=True)
+        full = get_recent_invocations(telemetry_dir, 60, sorted_log=False)
+        assert _ids(recent) == _ids(full)
+
+
+def test_recent_log_shorter_than_first_guess():
+    """A log smaller than the first tail guess is read from the start."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        telemetry_dir = Path(tmpdir)
+        telemetry_file = _write_sorted_log(telemetry_dir, hours=48)
+
+        assert _find_window_start(telemetry_file, 1) == 0
+        recent = get_recent_invocations(telemetry_dir, 1, sorted_log=True)
+        full = get_recent_invocations(telemetry_dir, 1, sorted_log=False)
+        assert recent and _ids(recent) == _ids(full)
+
+
+def test_recent_skips_lines_without_valid_timestamp(monkeypatch):
+    """Lines with missing or invalid timestamps never anchor the window.
+
+    The full scan keeps timestamp-less records anywhere in the log, so they
+    only match the tail read when they fall inside the window.
+    """
+    monkeypatch.setattr(telemetry_loader, "_TAIL_BYTES_PER_DAY", 1)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        telemetry_dir = Path(tmpdir)
+        telemetry_file = _write_sorted_log(telemetry_dir, hours=10 * 24)
+        with open(telemetry_file, "a") as f:
+            for i in range(50):
+                f.write(json.dumps({"invocation_id": f"bad-{i}"}) + "\n")
+                f.write(json.dumps({"invocation_id": f"bad-ts-{i}",
+                                    "timestamp": "yesterday"}) + "\n")
+
+        recent = get_recent_invocations(telemetry_dir, 2, sorted_log=True)
+        full = get_recent_invocations(telemetry_dir, 2, sorted_log=False)
+        assert recent and _ids(recent) == _ids(full)
+        assert "bad-0" in _ids(recent) and "bad-ts-0" not in _ids(recent)
+
+
+def _assert_index_matches_scan(telemetry_dir: Path, workflow_ids):
+    telemetry_file = telemetry_dir / "agent_invocations.jsonl"
+    for workflow_id in workflow_ids:
+        indexed = get_workflow_invocations(telemetry_dir, workflow_id)
+        scanned = load_invocations(telemetry_file, filter_workflow=workflow_id)
+        assert indexed == scanned
+
+
+def test_workflow_index_matches_scan():
+    """The workflow index tracks appends and rewrites of the log."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        telemetry_dir = Path(tmpdir)
+        logger = TelemetryLogger(telemetry_dir)
+        workflow_ids = ["wf-a", "wf-b", "wf-missing"]
+        inv_ids = [
+            logger.log_invocation(
+                agent_name=f"agent-{i}",
+                agent_type="test",
+                task_description="Indexed",
+                workflow_id=workflow_ids[i % 2],
+            )
+            for i in range(10)
+        ]
+
+        # First call builds the index file
+        _assert_index_matches_scan(telemetry_dir, workflow_ids)
+        assert (telemetry_dir / "agent_invocations.idx").exists()
+
+        # Appended lines invalidate it
+        for i in range(3):
+            logger.log_invocation(
+                agent_name="agent-late",
+                agent_type="test",
+                task_description="Appended",
+                workflow_id="wf-a",
+            )
+        _assert_index_matches_scan(telemetry_dir, workflow_ids)
+
+        # So does a rewrite that shifts every offset
+        logger.update_invocations_batch([
+            {"invocation_id": inv_id, "outcome_status": "success"}
+            for inv_id in inv_ids[::3]
+        ])
+        _assert_index_matches_scan(telemetry_dir, workflow_ids)
+        assert len(get_workflow_invocations(telemetry_dir, "wf-a")) == 8
+
+
+def test_workflow_index_corrupt_falls_back():
+    """A corrupt index file never changes the result."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        telemetry_dir = Path(tmpdir)
+        logger = TelemetryLogger(telemetry_dir)
+        for i in range(6):
+            logger.log_invocation(
+                agent_name=f"agent-{i}",
+                agent_type="test",
+                task_description="Indexed",
+                workflow_id="wf-a" if i % 2 else "wf-b",
+            )
+        telemetry_file = telemetry_dir / "agent_invocations.jsonl"
+        index_file = telemetry_dir / "agent_invocations.idx"
+
+        # Unreadable index: rebuilt
+        index_file.write_text("{not json")
+        _assert_index_matches_scan(telemetry_dir, ["wf-a", "wf-b"])
+
+        # Index that looks current but points mid-line: linear scan
+        st = telemetry_file.stat()
+        index_file.write_text(json.dumps({
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "workflow": {"wf-a": [1, 2, 3], "wf-b": [st.st_size - 2]},
+        }))
+        _assert_index_matches_scan(telemetry_dir, ["wf-a", "wf-b"])
+
+
+def test_workflow_empty_id_returns_everything():
+    """An empty workflow_id is not a filter, as in load_invocations."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        telemetry_dir = Path(tmpdir)
+        logger = TelemetryLogger(telemetry_dir)
+        for i in range(4):
+            logger.log_invocation(
+                agent_name=f"agent-{i}",
+                agent_type="test",
+                task_description="Indexed",
+                workflow_id="wf-a" if i % 2 else None,
+            )
+        telemetry_file = telemetry_dir / "agent_invocations.jsonl"
+
+        assert get_workflow_invocations(telemetry_dir, "") == load_invocations(telemetry_file)
+        assert len(get_workflow_invocations(telemetry_dir, "")) == 4
+
+        # Index rebuilds leave no temp files behind
+        get_workflow_invocations(telemetry_dir, "wf-a")
+        assert list(telemetry_dir.glob("*.tmp")) == []
@@ -8,7 +8,6 @@ End-to-end test of workflow telemetry logging and querying.
 import json
 import sys
 import tempfile
-import time
 from pathlib import Path
 
 # Add project root to Python path
@@ -55,7 +54,6 @@ def test_workflow_tracking():
             task_description="Design high-level architecture for e-commerce platform",
             state_features={"task": {"type": "architecture_design"}}
         )
-        time.sleep(0.1)  # Simulate work
         logger.update_invocation(
             invocation_id=inv_id_1,
             duration_seconds=1800,
@@ -85,7 +83,6 @@ def test_workflow_tracking():
             task_description="Implement API endpoints and database schema",
             state_features={"task": {"type": "backend_development"}}
         )
-        time.sleep(0.1)
         logger.update_invocation(
             invocation_id=inv_id_2,
             duration_seconds=2400,
@@ -121,7 +118,6 @@ def test_workflow_tracking():
             task_description="Build React UI components",
             state_features={"task": {"type": "frontend_development"}}
         )
-        time.sleep(0.1)
         logger.update_invocation(
             invocation_id=inv_id_3,
             duration_seconds=2300,
@@ -146,9 +142,6 @@ def test_workflow_tracking():
             agents_executed=["systems-architect", "backend-architect", "frontend-developer"]
         )
 
-        # Small delay to ensure file is flushed
-        time.sleep(0.1)
-
         # 8. Analyze workflow
         print("\nAnalyzing workflow data...")
         analyzer = TelemetryAnalyzer(telemetry_dir=tmpdir_path)